@@ -15,6 +15,8 @@ from enum import Enum
 ENV_ACE_IS_PRIMARY_NODE = "ACE_IS_PRIMARY_NODE"
 ENV_ACE_LOG_CONFIG_PATH = "ACE_LOG_CONFIG_PATH"
 ENV_FLUENT_BIT_TAG = "FLUENT_BIT_TAG"
+# size of the HTTP connection pool used by boto3 clients
+ENV_BOTO_MAX_POOL_CONNECTIONS = "BOTO_MAX_POOL_CONNECTIONS"
 
 
 DB_ACE = "ace"
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 import logging
 import os
 from typing import Optional
@@ -9,7 +10,17 @@ from saq.environment import get_global_runtime_settings
 from saq.error import report_exception
 
 
-def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None) -> bool:
+@contextmanager
+def _lock_connection(db=None):
+    """Yields the given database connection, or a connection from the pool if db is None."""
+    if db is not None:
+        yield db
+        return
+
+    with get_db_connection() as conn:
+        yield conn
+
+def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None, db=None) -> bool:
     """Locks a UUID for a given lock_uuid and lock_owner.
     If lock_owner is not provided, it will be set to the current process id.
 
@@ -17,6 +28,8 @@ def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None) ->
         uuid: The UUID of the object to lock.
         lock_uuid: The UUID of the lock. This is used to identify the lock in the database.
         lock_owner: The owner of the lock. This is used to identify the owner of the lock in the database.
+        db: The database connection to use. Defaults to a connection from the pool.
+            A connection passed in is committed by this function.
 
     Returns:
         True if the lock was acquired, False otherwise.
@@ -25,10 +38,10 @@ def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None) ->
         lock_owner = "{}-{}".format(os.getpid(), lock_uuid)
 
     try:
-        with get_db_connection() as db:
-            cursor = db.cursor()
+        with _lock_connection(db) as conn:
+            cursor = conn.cursor()
             logging.info("requesting lock on {} with lock uuid {} owned by {}".format(uuid, lock_uuid, lock_owner))
-            execute_with_retry(db, cursor, "INSERT INTO locks ( uuid, lock_uuid, lock_owner, lock_time ) VALUES ( %s, %s, %s, NOW() )", 
+            execute_with_retry(conn, cursor, "INSERT INTO locks ( uuid, lock_uuid, lock_owner, lock_time ) VALUES ( %s, %s, %s, NOW() )", 
                               ( uuid, lock_uuid, lock_owner ), commit=True)
 
             logging.info("locked {} with {}".format(uuid, lock_uuid))
@@ -37,9 +50,9 @@ def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None) ->
     except pymysql.err.IntegrityError:
         # if a lock already exists -- make sure it's owned by someone else
         try:
-            with get_db_connection() as db:
-                cursor = db.cursor()
-                execute_with_retry(db, cursor, "SELECT lock_uuid, lock_owner, TIMESTAMPDIFF(SECOND, lock_time, NOW()) FROM locks WHERE uuid = %s", (uuid,))
+            with _lock_connection(db) as conn:
+                cursor = conn.cursor()
+                execute_with_retry(conn, cursor, "SELECT lock_uuid, lock_owner, TIMESTAMPDIFF(SECOND, lock_time, NOW()) FROM locks WHERE uuid = %s", (uuid,))
                 row = cursor.fetchone()
                 if row:
                     current_lock_uuid, current_lock_owner, current_lock_timeout = row
@@ -52,7 +65,7 @@ def acquire_lock(uuid: str, lock_uuid: str, lock_owner: Optional[str] = None) ->
 
                 # assume we already own the lock -- this will be true in subsequent calls
                 # to acquire the lock
-                execute_with_retry(db, cursor, """
+                execute_with_retry(conn, cursor, """
 UPDATE locks 
 SET 
     lock_time = NOW(),
@@ -62,7 +75,7 @@ WHERE
     uuid = %s 
     AND ( lock_uuid = %s OR TIMESTAMPDIFF(SECOND, lock_time, NOW()) >= %s )
 """, (lock_uuid, lock_owner, uuid, lock_uuid, get_global_runtime_settings().lock_timeout_seconds))
-                db.commit()
+                conn.commit()
 
                 cursor.execute("SELECT lock_uuid, lock_owner FROM locks WHERE uuid = %s", (uuid,))
                 row = cursor.fetchone()
@@ -92,12 +105,14 @@ WHERE
         report_exception()
         return False
 
-def release_lock(uuid: str, lock_uuid: str, ignore_lock_failure: bool = False) -> bool:
+def release_lock(uuid: str, lock_uuid: str, ignore_lock_failure: bool = False, db=None) -> bool:
     """Releases a lock acquired by acquire_lock.
 
     Parameters:
         uuid: The UUID of the object to release the lock on.
         lock_uuid: The UUID of the lock to release.
+        db: The database connection to use. Defaults to a connection from the pool.
+            A connection passed in is committed by this function.
 
     Returns:
         True if the lock was released, False otherwise.
@@ -110,10 +125,10 @@ def release_lock(uuid: str, lock_uuid: str, ignore_lock_failure: bool = False) -
         if not isinstance(lock_uuid, str) or not uuid:
             raise ValueError(f"attempting to release an invalid lock_uuid: {lock_uuid}")
 
-        with get_db_connection() as db:
-            cursor = db.cursor()
-            execute_with_retry(db, cursor, "DELETE FROM locks WHERE uuid = %s AND lock_uuid = %s", (uuid, lock_uuid,))
-            db.commit()
+        with _lock_connection(db) as conn:
+            cursor = conn.cursor()
+            execute_with_retry(conn, cursor, "DELETE FROM locks WHERE uuid = %s AND lock_uuid = %s", (uuid, lock_uuid,))
+            conn.commit()
             if cursor.rowcount == 1:
                 logging.info("released lock on {}".format(uuid))
             else:
@@ -146,13 +161,14 @@ def force_release_lock(uuid: str) -> bool:
 
     return False
 
-def clear_expired_locks() -> int:
-    """Clear any locks that have exceeded g_int(G_LOCK_TIMEOUT_SECONDS)."""
-    with get_db_connection() as db:
-        c = db.cursor()
-        execute_with_retry(db, c, "DELETE FROM locks WHERE TIMESTAMPDIFF(SECOND, lock_time, NOW()) >= %s",
+def clear_expired_locks(db=None) -> int:
+    """Clear any locks that have exceeded g_int(G_LOCK_TIMEOUT_SECONDS).
+    Uses the given database connection (which is committed), or a connection from the pool if db is None."""
+    with _lock_connection(db) as conn:
+        c = conn.cursor()
+        execute_with_retry(conn, c, "DELETE FROM locks WHERE TIMESTAMPDIFF(SECOND, lock_time, NOW()) >= %s",
                                   (get_global_runtime_settings().lock_timeout_seconds,))
-        db.commit()
+        conn.commit()
         if c.rowcount:
             logging.info("removed {} expired locks".format(c.rowcount))
 
@@ -34,6 +34,16 @@ def _format_message(monitor: Monitor, value: Any, identifier: Optional[str]=None
 
 class MonitorEmitter:
     def __init__(self):
+        self._suppression_lock = RLock()
+        self._dedup_lock = RLock()
+        self.cache_lock = RLock()
+        self.fluent_bit_sender = None
+        self.reset()
+
+    def reset(self):
+        """Returns the emitter to its initial state (all outputs disabled, no definitions, empty cache).
+        Closes the fluent-bit sender if there is one."""
+        self.close()
         self.use_logging = False
         self.use_stdout = False
         self.use_stderr = False
@@ -44,14 +54,14 @@ class MonitorEmitter:
         # monitor definitions
         self.definitions: list["MonitorDefinitionConfig"] = []
         self._definition_cache: dict[str, Optional["MonitorDefinitionConfig"]] = {}
-        self._suppression_lock = RLock()
-        self._last_emission_times: dict[str, datetime] = {}
-        self._dedup_lock = RLock()
-        self._last_emitted_values: dict[str, Any] = {}
+        with self._suppression_lock:
+            self._last_emission_times: dict[str, datetime] = {}
+        with self._dedup_lock:
+            self._last_emitted_values: dict[str, Any] = {}
 
         # in-memory cache
-        self.cache = {}
-        self.cache_lock = RLock()
+        with self.cache_lock:
+            self.cache = {}
 
     def set_definitions(self, definitions: list["MonitorDefinitionConfig"]):
         self.definitions = definitions
@@ -168,9 +178,8 @@ def get_emitter() -> MonitorEmitter:
     return global_emitter
 
 def reset_emitter():
-    global global_emitter
-    global_emitter.close()
-    global_emitter = MonitorEmitter()
+    # reset in place so references to the emitter stay valid
+    global_emitter.reset()
 
 def emit_monitor(monitor: Monitor, value: Any, identifier: Optional[str]=None) -> bool:
     assert isinstance(value, monitor.data_type)
@@ -2,6 +2,7 @@
 from abc import abstractmethod
 import logging
 import threading
+from typing import Optional
 
 from saq.error.reporting import report_exception
 
@@ -29,7 +30,7 @@ class ACEThreadedMonitor:
         ... # pragma: no cover
 
     def start(self):
-        self.main_thread = threading.Thread(target=self.main_loop, name=self.name)
+        self.main_thread = threading.Thread(target=self.main_loop, name=self.name, daemon=True)
         self.main_thread.start()
 
     def wait_for_start(self, timeout: float = 5) -> bool:
@@ -41,5 +42,7 @@ class ACEThreadedMonitor:
     def stop(self):
         self.shutdown_event.set()
 
-    def wait(self):
-        self.main_thread.join()
\ No newline at end of file
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the monitor thread to exit. Returns True if the thread has stopped, False if the timeout expired."""
+        self.main_thread.join(timeout)
+        return not self.main_thread.is_alive()
\ No newline at end of file
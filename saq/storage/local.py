@@ -6,16 +6,36 @@ for storing and retrieving files using the local filesystem. Buckets are mapped
 to subdirectories under a configurable base directory.
 """
 
+import functools
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from saq.storage.error import StorageError
 from saq.storage.interface import StorageInterface
 
 
+def _iter_files(directory: str, rel_dir: str) -> Iterator[str]:
+    """Recursively yield the paths (relative to rel_dir) of all files under directory.
+    Symlinked directories are not followed."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            rel = os.path.join(rel_dir, entry.name)
+            if entry.is_dir() and not entry.is_symlink():
+                yield from _iter_files(entry.path, rel)
+            elif entry.is_file():
+                yield rel
+
+
+@functools.lru_cache(maxsize=256)
+def _get_bucket_path(base_dir: Path, bucket: str) -> Path:
+    # Path objects are immutable so the joined path can be shared
+    return base_dir / bucket
+
+
 class LocalStorage(StorageInterface):
     """
     Local filesystem storage implementation.
@@ -36,7 +56,7 @@ class LocalStorage(StorageInterface):
 
     def _bucket_path(self, bucket: str) -> Path:
         """Return the filesystem path for a bucket."""
-        return self.base_dir / bucket
+        return _get_bucket_path(self.base_dir, bucket)
 
     def _object_path(self, bucket: str, remote_path: str) -> Path:
         """Return the filesystem path for an object."""
@@ -58,7 +78,9 @@ class LocalStorage(StorageInterface):
         dest.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            shutil.copy2(str(local_path), str(dest))
+            # copyfile copies in the kernel (os.sendfile) where the platform supports it
+            # and does not copy file metadata (mode bits, times), so dest gets a fresh modification time
+            shutil.copyfile(local_path, dest)
             logging.info("uploaded %s to %s/%s", local_path, bucket, remote_path)
             return str(dest)
         except Exception as e:
@@ -66,6 +88,18 @@ class LocalStorage(StorageInterface):
             logging.error(error_msg)
             raise StorageError(error_msg)
 
+    def _seed(self, bucket: str, objects: dict[str, bytes]) -> None:
+        """Write the given contents directly into the bucket, keyed by remote path.
+        Used to pre-populate storage without going through upload_file."""
+        created_dirs = set()
+        for remote_path, data in objects.items():
+            dest = self._object_path(bucket, remote_path)
+            if dest.parent not in created_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(dest.parent)
+
+            dest.write_bytes(data)
+
     def download_file(
         self,
         bucket: str,
@@ -81,7 +115,8 @@ class LocalStorage(StorageInterface):
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            shutil.copy2(str(src), str(local_path))
+            # see upload_file
+            shutil.copyfile(src, local_path)
             logging.info("downloaded %s/%s to %s", bucket, remote_path, local_path)
             return str(local_path)
         except Exception as e:
@@ -95,31 +130,33 @@ class LocalStorage(StorageInterface):
         if not bucket_dir.exists():
             return []
 
-        result = []
         search_dir = bucket_dir / prefix if prefix else bucket_dir
 
-        if not search_dir.exists():
+        if not search_dir.is_dir():
             return []
 
+        # object names are relative to the bucket directory
+        rel_dir = str(search_dir.relative_to(bucket_dir)) if prefix else ""
+
         try:
             if recursive:
-                for path in search_dir.rglob("*"):
-                    if path.is_file():
-                        result.append(str(path.relative_to(bucket_dir)))
-            else:
-                for path in search_dir.iterdir():
-                    rel = str(path.relative_to(bucket_dir))
-                    if path.is_dir():
+                return list(_iter_files(str(search_dir), rel_dir))
+
+            result = []
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    rel = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir():
                         result.append(rel + "/")
                     else:
                         result.append(rel)
+
+            return result
         except Exception as e:
             error_msg = f"failed to list objects in bucket {bucket}: {e}"
             logging.error(error_msg)
             raise StorageError(error_msg)
 
-        return result
-
     def list_buckets(self) -> list:
         """List all available buckets."""
         try:
@@ -9,11 +9,13 @@ from dataclasses import dataclass
 import logging
 import os
 from pathlib import Path
-from typing import Union, Optional
+import threading
+from typing import Any, BinaryIO, Callable, Union, Optional
 from urllib.parse import urljoin
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     import botocore.exceptions
     from botocore.config import Config as BotoConfig
     HAS_BOTO3 = True
@@ -22,14 +24,40 @@ except ImportError:
 
 
 from saq.configuration.config import get_config
+from saq.constants import ENV_BOTO_MAX_POOL_CONNECTIONS
 from saq.storage.interface import StorageInterface
 from saq.storage.error import StorageError
 
 
+# boto3 defaults to a pool of 10 connections which is too small for concurrent transfers
+DEFAULT_BOTO_MAX_POOL_CONNECTIONS = 50
+
+# managed transfer (upload_file/download_file) settings, larger than the boto3 defaults
+DEFAULT_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+DEFAULT_TRANSFER_MAX_CONCURRENCY = 16
+DEFAULT_TRANSFER_IO_CHUNKSIZE = 1024 * 1024
+
 def _require_boto3():
     if not HAS_BOTO3:
         raise StorageError("boto3 is required for S3 storage - install it with: pip install boto3")
 
+def _get_boto_config(**kwargs) -> "BotoConfig":
+    """Returns the botocore client configuration shared by all S3 clients.
+    The connection pool size can be overridden with the BOTO_MAX_POOL_CONNECTIONS environment variable."""
+    return BotoConfig(
+        max_pool_connections=int(os.environ.get(ENV_BOTO_MAX_POOL_CONNECTIONS, DEFAULT_BOTO_MAX_POOL_CONNECTIONS)),
+        retries={"max_attempts": 3, "mode": "standard"},
+        **kwargs)
+
+def _get_transfer_config() -> "TransferConfig":
+    """Returns the default configuration used for managed uploads and downloads."""
+    return TransferConfig(
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_TRANSFER_MAX_CONCURRENCY,
+        io_chunksize=DEFAULT_TRANSFER_IO_CHUNKSIZE)
+
 @dataclass
 class S3Credentials:
     access_key: str
@@ -40,10 +68,23 @@ class S3Credentials:
 def get_s3_credentials_from_config() -> S3Credentials:
     """Get the S3 credentials from the configuration."""
     _require_boto3()
+    s3_config = get_config().s3
     return S3Credentials(
-        access_key=get_config().s3.access_key,
-        secret_key=get_config().s3.secret_key,
-        region=get_config().s3.region)
+        access_key=s3_config.access_key,
+        secret_key=s3_config.secret_key,
+        region=s3_config.region)
+
+# boto3 clients are thread safe and expensive to create, so they are shared
+# keyed by the settings used to create them
+# the clients (and their connection pools) are not fork safe so they are only used by the process that created them
+_global_s3_clients: dict[tuple, Any] = {}
+_global_s3_clients_pid = os.getpid()
+_global_s3_clients_lock = threading.Lock()
+
+def reset_s3_clients():
+    """Discards all cached S3 clients."""
+    with _global_s3_clients_lock:
+        _global_s3_clients.clear()
 
 def get_s3_client(region: Optional[str] = None):
     """Returns an S3 client.
@@ -52,13 +93,43 @@ def get_s3_client(region: Optional[str] = None):
     a client configured with explicit endpoint and credentials for that service.
 
     Otherwise, returns a native AWS S3 client that uses the standard boto3
-    credential chain (IAM roles, environment variables, etc.)."""
+    credential chain (IAM roles, environment variables, etc.).
+
+    Clients are cached and the same client is returned for the same settings."""
     _require_boto3()
 
     s3_config = get_config().s3
+    if s3_config is None:
+        cache_key = (region,)
+    else:
+        cache_key = (
+            s3_config.host,
+            s3_config.port,
+            s3_config.access_key,
+            s3_config.secret_key,
+            s3_config.region,
+            s3_config.secure,
+            s3_config.cert_check)
+
+    global _global_s3_clients_pid
+    with _global_s3_clients_lock:
+        # if the clients were created on another process (we were forked) then create new ones
+        # and ignore the old ones (which may still be used by the parent process)
+        if _global_s3_clients_pid != os.getpid():
+            _global_s3_clients.clear()
+            _global_s3_clients_pid = os.getpid()
+            logging.debug(f"discarded s3 clients inherited by pid {_global_s3_clients_pid}")
+
+        client = _global_s3_clients.get(cache_key)
+        if client is None:
+            client = _global_s3_clients[cache_key] = _create_s3_client(s3_config, region)
+
+        return client
+
+def _create_s3_client(s3_config, region: Optional[str] = None):
     if s3_config is None:
         # AWS-native path: let boto3 handle credentials via IAM roles, env vars, etc.
-        return boto3.client("s3", region_name=region)
+        return boto3.client("s3", region_name=region, config=_get_boto_config())
 
     # Self-hosted S3-compatible path (e.g. MinIO, GarageHQ)
     s3_credentials = get_s3_credentials_from_config()
@@ -68,8 +139,7 @@ def get_s3_client(region: Optional[str] = None):
     secure = s3_config.secure
     cert_check = s3_config.cert_check
 
-    protocol = "https" if secure else "http"
-    endpoint_url = f"{protocol}://{host}:{port}"
+    endpoint_url = f"{'https' if secure else 'http'}://{host}:{port}"
 
     return boto3.client(
         "s3",
@@ -78,7 +148,7 @@ def get_s3_client(region: Optional[str] = None):
         aws_secret_access_key=s3_credentials.secret_key,
         region_name=s3_credentials.region,
         verify=cert_check,
-        config=BotoConfig(signature_version="s3v4"))
+        config=_get_boto_config(signature_version="s3v4"))
 
 
 class S3Storage(StorageInterface):
@@ -98,7 +168,8 @@ class S3Storage(StorageInterface):
         secure: bool = False,
         region: Optional[str] = None,
         session_token: Optional[str] = None,
-        config: Optional[dict] = None
+        config: Optional[dict] = None,
+        transfer_config: Optional["TransferConfig"] = None,
     ):
         """
         Initialize the S3 storage client.
@@ -112,6 +183,7 @@ class S3Storage(StorageInterface):
             region: S3 region (optional)
             session_token: Session token for temporary credentials (optional)
             config: Custom configuration dict (optional), supports 'verify' key
+            transfer_config: boto3 TransferConfig used for uploads and downloads (optional)
         """
         _require_boto3()
 
@@ -126,10 +198,12 @@ class S3Storage(StorageInterface):
         self.access_key = access_key
         self.secret_key = secret_key
 
-        # Build endpoint URL
+        # Build endpoint URL once, it is also the base of the generated file URLs
         self.endpoint = f"{host}:{port}"
-        protocol = "https" if secure else "http"
-        endpoint_url = f"{protocol}://{self.endpoint}"
+        self.endpoint_url = f"{'https' if secure else 'http'}://{self.endpoint}"
+
+        # used for all managed transfers made by this instance
+        self.transfer_config = transfer_config if transfer_config is not None else _get_transfer_config()
 
         if config is None:
             config = {}
@@ -140,12 +214,12 @@ class S3Storage(StorageInterface):
         try:
             self.client = boto3.client(
                 "s3",
-                endpoint_url=endpoint_url,
+                endpoint_url=self.endpoint_url,
                 aws_access_key_id=self.access_key,
                 aws_secret_access_key=self.secret_key,
                 region_name=region,
                 verify=verify,
-                config=BotoConfig(signature_version="s3v4"),
+                config=_get_boto_config(signature_version="s3v4"),
             )
 
         except botocore.exceptions.BotoCoreError as e:
@@ -184,6 +258,53 @@ class S3Storage(StorageInterface):
         if not os.path.exists(local_path_str):
             raise FileNotFoundError(f"source file not found: {local_path_str}")
 
+        return self._upload(self.client.upload_file, local_path_str, f"file {local_path_str}", bucket, remote_path, **kwargs)
+
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        bucket: str,
+        remote_path: str,
+        **kwargs
+    ) -> str:
+        """
+        Upload the contents of a readable binary file-like object to S3 storage.
+
+        Args:
+            fileobj: File-like object (e.g. io.BytesIO) to read the content from
+            bucket: Bucket to upload the content to
+            remote_path: Remote path to upload the content to
+
+        Returns:
+            str: The URL or identifier of the uploaded file
+
+        Raises:
+            StorageError: If upload fails
+        """
+        return self._upload(self.client.upload_fileobj, fileobj, "file object", bucket, remote_path, **kwargs)
+
+    def _upload(
+        self,
+        transfer: Callable,
+        source: Any,
+        description: str,
+        bucket: str,
+        remote_path: str,
+        **kwargs
+    ) -> str:
+        """
+        Shared implementation of upload_file and upload_fileobj.
+
+        Args:
+            transfer: The boto3 managed transfer method to call (client.upload_file or client.upload_fileobj)
+            source: The local path or file object passed to transfer
+            description: Describes the source in log and error messages
+            bucket: Bucket to upload to
+            remote_path: Remote path to upload to
+
+        Returns:
+            str: The URL or identifier of the uploaded file
+        """
         # Ensure bucket exists
         self._ensure_bucket_exists(bucket)
 
@@ -193,26 +314,26 @@ class S3Storage(StorageInterface):
             if "metadata" in kwargs:
                 extra_args["Metadata"] = kwargs.pop("metadata")
 
-            # Upload the file
-            self.client.upload_file(
-                local_path_str,
+            transfer(
+                source,
                 bucket,
                 remote_path,
                 ExtraArgs=extra_args if extra_args else None,
+                Config=self.transfer_config,
             )
 
             # Generate URL for the uploaded file
             file_url = self._generate_file_url(bucket, remote_path)
 
-            logging.info("uploaded %s to %s/%s", local_path_str, bucket, remote_path)
+            logging.info("uploaded %s to %s/%s", description, bucket, remote_path)
             return file_url
 
         except botocore.exceptions.ClientError as e:
-            error_msg = f"failed to upload file {local_path_str} to {bucket}/{remote_path}: {e}"
+            error_msg = f"failed to upload {description} to {bucket}/{remote_path}: {e}"
             logging.error(error_msg)
             raise StorageError(error_msg)
         except Exception as e:
-            error_msg = f"unexpected error uploading file {local_path_str}: {e}"
+            error_msg = f"unexpected error uploading {description} to {bucket}/{remote_path}: {e}"
             logging.error(error_msg)
             raise StorageError(error_msg)
 
@@ -259,6 +380,7 @@ class S3Storage(StorageInterface):
                 bucket,
                 remote_path,
                 local_path_str,
+                Config=self.transfer_config,
             )
 
             logging.info("downloaded %s/%s to %s", bucket, remote_path, local_path_str)
@@ -310,9 +432,7 @@ class S3Storage(StorageInterface):
         Returns:
             str: URL for the file
         """
-        protocol = "https" if self.secure else "http"
-        base_url = f"{protocol}://{self.endpoint}"
-        return urljoin(base_url, f"{bucket}/{remote_path}")
+        return urljoin(self.endpoint_url, f"{bucket}/{remote_path}")
 
     def list_buckets(self) -> list:
         """
@@ -336,7 +456,7 @@ class S3Storage(StorageInterface):
             logging.error(error_msg)
             raise StorageError(error_msg)
 
-    def list_objects(self, bucket: str, prefix: str = "", recursive: bool = True) -> list:
+    def list_objects(self, bucket: str, prefix: str = "", recursive: bool = True, max_keys: Optional[int] = None) -> list:
         """
         List objects in a bucket with optional prefix filtering.
 
@@ -344,6 +464,7 @@ class S3Storage(StorageInterface):
             bucket: Name of the bucket to list objects from
             prefix: Prefix to filter objects by (optional)
             recursive: Whether to list objects recursively (default: True)
+            max_keys: Maximum number of entries to return (optional, defaults to all)
 
         Returns:
             list: List of object names
@@ -358,6 +479,10 @@ class S3Storage(StorageInterface):
                 kwargs["Delimiter"] = "/"
 
             while True:
+                if max_keys is not None:
+                    # only ask the server for as many entries as are still needed
+                    kwargs["MaxKeys"] = max_keys - len(result)
+
                 response = self.client.list_objects_v2(**kwargs)
 
                 # collect object keys
@@ -369,11 +494,17 @@ class S3Storage(StorageInterface):
                     for prefix_entry in response.get("CommonPrefixes", []):
                         result.append(prefix_entry["Prefix"])
 
+                if max_keys is not None and len(result) >= max_keys:
+                    break
+
                 if response.get("IsTruncated"):
                     kwargs["ContinuationToken"] = response["NextContinuationToken"]
                 else:
                     break
 
+            if max_keys is not None:
+                return result[:max_keys]
+
             return result
         except botocore.exceptions.ClientError as e:
             error_msg = f"failed to list objects in bucket {bucket}: {e}"
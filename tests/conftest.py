@@ -32,6 +32,7 @@ from saq.modules.context import AnalysisModuleContext
 from saq.monitor import reset_emitter
 from saq.permissions.user import add_user_permission
 from saq.remediation.target import reset_observable_remediation_interface_registry
+from saq.storage.s3 import reset_s3_clients
 from saq.util.uuid import storage_dir_from_uuid
 from tests.saq.helpers import reset_unittest_logging, start_api_server, stop_api_server, initialize_unittest_logging
 from tests.saq.test_util import create_test_context
@@ -271,6 +272,9 @@ def global_function_setup(request):
     # reset emitter to default state
     reset_emitter()
 
+    # tests may change the s3 configuration
+    reset_s3_clients()
+
     # XXX we're initializing AND THEN we're resetting the database
 
     # remember the original sys.path
@@ -325,6 +329,7 @@ def global_function_setup(request):
 
     # restore the original configuration
     set_config(config_copy)
+    reset_s3_clients()
 
     # restore the original global runtime settings
     set_global_runtime_settings(global_runtime_settings_copy)
@@ -481,3 +486,22 @@ def pytest_sessionstart(session):
     for dir_path in get_valid_integration_dirs():
         load_integration_component_src(dir_path)
 
+#
+# tmp_path and tmpdir are mostly used for small files so set ACE3_TMPFS_TEMP to put them on tmpfs
+# when it is available and has room to spare (an explicit --basetemp or PYTEST_DEBUG_TEMPROOT takes precedence)
+# this is opt-in since it applies to every test and pytest keeps the temp dirs of the last three runs (in memory)
+# NOTE the free space is only checked at startup
+#
+
+SHM_DIR = "/dev/shm"
+SHM_MIN_FREE_BYTES = 1024 * 1024 * 1024
+
+def pytest_configure(config):
+    if not os.environ.get("ACE3_TMPFS_TEMP"):
+        return
+
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK) and shutil.disk_usage(SHM_DIR).free >= SHM_MIN_FREE_BYTES:
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = SHM_DIR
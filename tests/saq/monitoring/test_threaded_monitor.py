@@ -1,4 +1,6 @@
+import logging
 import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -38,62 +40,51 @@ class TestACEThreadedMonitor:
             # give the thread a moment to start
             assert monitor.main_thread.is_alive()
             assert monitor.main_thread.name == "test_monitor"
+            assert monitor.main_thread.daemon
         finally:
             monitor.stop()
-            monitor.wait()
+            stopped = monitor.wait(timeout=1.0)
 
-    def test_main_loop_calls_execute(self):
-        monitor = ConcreteTestMonitor(frequency=0.05)
-        try:
-            monitor.start()
-            # wait for at least one execute call
-            for _ in range(100):
-                if monitor.execute_count >= 1:
-                    break
-                threading.Event().wait(0.01)
-            assert monitor.execute_count >= 1
-        finally:
-            monitor.stop()
-            monitor.wait()
+        assert stopped
 
+    @pytest.mark.parametrize("side_effect,expected_count,check_log", [
+        (None, 1, False),
+        # the loop must keep running after an exception
+        (RuntimeError("test error"), 2, False),
+        (ValueError("something went wrong"), 1, True),
+    ])
     @patch("saq.monitoring.threaded_monitor.report_exception")
-    def test_main_loop_catches_exception(self, mock_report):
-        error = RuntimeError("test error")
-        monitor = ConcreteTestMonitor(frequency=0.05, execute_side_effect=error)
+    def test_main_loop(self, mock_report, caplog, side_effect, expected_count, check_log):
+        monitor = ConcreteTestMonitor(name="error_monitor", frequency=0.05, execute_side_effect=side_effect)
         try:
             monitor.start()
-            # wait for at least two executions to verify the loop continues
+            # wait for the expected number of execute calls
             for _ in range(100):
-                if monitor.execute_count >= 2:
+                if monitor.execute_count >= expected_count:
                     break
-                threading.Event().wait(0.01)
-            assert monitor.execute_count >= 2
-            mock_report.assert_called_with(error)
+                time.sleep(0.01)
+            assert monitor.execute_count >= expected_count
         finally:
             monitor.stop()
-            monitor.wait()
+            stopped = monitor.wait(timeout=1.0)
 
-    @patch("saq.monitoring.threaded_monitor.report_exception")
-    def test_main_loop_logs_error_on_exception(self, mock_report, caplog):
-        error = ValueError("something went wrong")
-        monitor = ConcreteTestMonitor(name="error_monitor", frequency=0.05, execute_side_effect=error)
-        try:
-            monitor.start()
-            for _ in range(100):
-                if monitor.execute_count >= 1:
-                    break
-                threading.Event().wait(0.01)
-        finally:
-            monitor.stop()
-            monitor.wait()
+        assert stopped
+
+        if side_effect is None:
+            mock_report.assert_not_called()
+        else:
+            mock_report.assert_called_with(side_effect)
 
-        assert any("error_monitor" in record.message for record in caplog.records)
+        if check_log:
+            # the monitor logs through the root logger so filter on level rather than logger name
+            error_records = [record for record in caplog.records if record.levelno >= logging.ERROR]
+            assert any("error_monitor" in record.getMessage() for record in error_records)
 
     def test_stop_and_wait_joins_thread(self):
         monitor = ConcreteTestMonitor(frequency=0.05)
         monitor.start()
         monitor.stop()
-        monitor.wait()
+        assert monitor.wait(timeout=1.0)
         assert not monitor.main_thread.is_alive()
 
     def test_wait_for_start_true_when_set(self):
@@ -103,4 +94,6 @@ class TestACEThreadedMonitor:
 
     def test_wait_for_start_false_on_timeout(self):
         monitor = ConcreteTestMonitor()
-        assert monitor.wait_for_start(timeout=0.01) is False
+        start = time.monotonic()
+        assert monitor.wait_for_start(timeout=0.001) is False
+        assert time.monotonic() - start >= 0.001
@@ -0,0 +1,85 @@
+import itertools
+import os
+from typing import Callable, Optional
+
+import pytest
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from saq.constants import F_TEST
+from saq.database.model import Remediation
+from saq.database.pool import get_db, set_db
+from saq.environment import get_global_runtime_settings
+from saq.remediation.target import RemediationTarget
+from saq.remediation.types import RemediationAction, RemediationStatus, RemediatorStatus
+
+
+@pytest.fixture
+def rollback_db():
+    """Runs the test inside an outer transaction that is rolled back on teardown.
+
+    get_db() is swapped for a session bound to a single connection, so commits made by the
+    code under test only release a SAVEPOINT and nothing the test creates is left behind."""
+    original_session = get_db()
+    connection = original_session.get_bind().connect()
+    transaction = connection.begin()
+    set_db(scoped_session(sessionmaker(bind=connection, join_transaction_mode="create_savepoint")))
+
+    yield connection
+
+    get_db().remove()
+    transaction.rollback()
+    connection.close()
+    set_db(original_session)
+
+
+@pytest.fixture
+def unique_key(request) -> Callable[[], str]:
+    """Returns a callable that generates remediation keys unique to this test and pytest-xdist worker."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    counter = itertools.count()
+    return lambda: f"{worker_id}_{request.node.name}_{next(counter)}"
+
+
+@pytest.fixture
+def no_expire_on_commit():
+    """Keeps loaded instances populated across commits for the duration of the test.
+
+    Tests that modify rows with bulk (core) statements must call get_db().expire_all()
+    before reading those rows back through previously loaded instances."""
+    session = get_db()()
+    session.expire_on_commit = False
+    yield session
+    session.expire_on_commit = True
+
+
+def queue_in_progress(value: str, action: RemediationAction = RemediationAction.REMOVE, restore_key: Optional[str] = None) -> int:
+    """Queues a custom remediation for the given F_TEST value and marks it IN_PROGRESS. Returns the remediation id."""
+    remediation_id = RemediationTarget("custom", F_TEST, value).queue_remediation(
+        action, get_global_runtime_settings().automation_user_id, restore_key
+    )
+    get_db().query(Remediation).filter(Remediation.id == remediation_id).update(
+        {Remediation.status: RemediationStatus.IN_PROGRESS.value}
+    )
+    get_db().commit()
+    return remediation_id
+
+
+def queue_completed(
+    value: str,
+    result: RemediatorStatus = RemediatorStatus.SUCCESS,
+    action: RemediationAction = RemediationAction.REMOVE,
+    restore_key: Optional[str] = None,
+) -> int:
+    """Queues a custom remediation for the given F_TEST value and marks it COMPLETED with the given result.
+    Returns the remediation id."""
+    remediation_id = RemediationTarget("custom", F_TEST, value).queue_remediation(
+        action, get_global_runtime_settings().automation_user_id, restore_key
+    )
+    get_db().query(Remediation).filter(Remediation.id == remediation_id).update(
+        {
+            Remediation.status: RemediationStatus.COMPLETED.value,
+            Remediation.result: result.value,
+        }
+    )
+    get_db().commit()
+    return remediation_id
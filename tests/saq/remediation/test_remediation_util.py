@@ -23,13 +23,16 @@ from saq.remediation.util import (
     restore_remediations,
     retry_remediations,
 )
+from tests.saq.remediation.conftest import queue_completed, queue_in_progress
+
+pytestmark = pytest.mark.usefixtures("rollback_db", "no_expire_on_commit")
 
 
 @pytest.mark.integration
-def test_cancel_remediations_basic():
+def test_cancel_remediations_basic(unique_key):
     """test cancelling remediations without comment or user_id"""
     # create a remediation
-    target = RemediationTarget("custom", F_TEST, "test_value_1")
+    target = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id = target.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
@@ -45,6 +48,7 @@ def test_cancel_remediations_basic():
     # cancel the remediation
     count = cancel_remediations([remediation_id])
     assert count == 1
+    get_db().expire_all()
 
     # verify the remediation was cancelled
     remediation = get_db().query(Remediation).filter(Remediation.id == remediation_id).first()
@@ -65,17 +69,9 @@ def test_cancel_remediations_basic():
 
 
 @pytest.mark.integration
-def test_cancel_remediations_with_comment():
+def test_cancel_remediations_with_comment(unique_key):
     """test cancelling remediations with a custom comment"""
-    target = RemediationTarget("custom", F_TEST, "test_value_2")
-    remediation_id = target.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    # update status to IN_PROGRESS
-    remediation = get_db().query(Remediation).filter(Remediation.id == remediation_id).first()
-    remediation.status = RemediationStatus.IN_PROGRESS.value
-    get_db().commit()
+    remediation_id = queue_in_progress(unique_key())
 
     # cancel with custom comment
     custom_comment = "testing custom cancellation"
@@ -93,17 +89,9 @@ def test_cancel_remediations_with_comment():
 
 
 @pytest.mark.integration
-def test_cancel_remediations_with_user_id():
+def test_cancel_remediations_with_user_id(unique_key):
     """test cancelling remediations with a user_id"""
-    target = RemediationTarget("custom", F_TEST, "test_value_3")
-    remediation_id = target.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    # update status to IN_PROGRESS
-    remediation = get_db().query(Remediation).filter(Remediation.id == remediation_id).first()
-    remediation.status = RemediationStatus.IN_PROGRESS.value
-    get_db().commit()
+    remediation_id = queue_in_progress(unique_key())
 
     # get the automation user
     user = (
@@ -129,28 +117,16 @@ def test_cancel_remediations_with_user_id():
 
 
 @pytest.mark.integration
-def test_cancel_remediations_multiple():
+def test_cancel_remediations_multiple(unique_key):
     """test cancelling multiple remediations at once"""
-    # create multiple remediations
-    target1 = RemediationTarget("custom", F_TEST, "test_value_4")
-    remediation_id1 = target1.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    target2 = RemediationTarget("custom", F_TEST, "test_value_5")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    # update both to IN_PROGRESS
-    for rid in [remediation_id1, remediation_id2]:
-        remediation = get_db().query(Remediation).filter(Remediation.id == rid).first()
-        remediation.status = RemediationStatus.IN_PROGRESS.value
-    get_db().commit()
+    # create multiple IN_PROGRESS remediations
+    remediation_id1 = queue_in_progress(unique_key())
+    remediation_id2 = queue_in_progress(unique_key())
 
     # cancel both
     count = cancel_remediations([remediation_id1, remediation_id2])
     assert count == 2
+    get_db().expire_all()
 
     # verify both were cancelled
     for rid in [remediation_id1, remediation_id2]:
@@ -160,26 +136,21 @@ def test_cancel_remediations_multiple():
 
 
 @pytest.mark.integration
-def test_cancel_remediations_only_in_progress():
+def test_cancel_remediations_only_in_progress(unique_key):
     """test that only IN_PROGRESS remediations are cancelled"""
     # create a remediation that is NEW
-    target1 = RemediationTarget("custom", F_TEST, "test_value_6")
+    target1 = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id1 = target1.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
 
     # create a remediation that is IN_PROGRESS
-    target2 = RemediationTarget("custom", F_TEST, "test_value_7")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-    remediation2 = get_db().query(Remediation).filter(Remediation.id == remediation_id2).first()
-    remediation2.status = RemediationStatus.IN_PROGRESS.value
-    get_db().commit()
+    remediation_id2 = queue_in_progress(unique_key())
 
     # try to cancel both
     count = cancel_remediations([remediation_id1, remediation_id2])
     assert count == 2
+    get_db().expire_all()
 
     # verify only the IN_PROGRESS one was actually updated
     remediation1 = get_db().query(Remediation).filter(Remediation.id == remediation_id1).first()
@@ -190,10 +161,10 @@ def test_cancel_remediations_only_in_progress():
 
 
 @pytest.mark.integration
-def test_retry_remediations():
+def test_retry_remediations(unique_key):
     """test retrying completed remediations"""
     # create a remediation and mark it as completed
-    target = RemediationTarget("custom", F_TEST, "test_value_8")
+    target = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id = target.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
@@ -207,6 +178,7 @@ def test_retry_remediations():
     # retry the remediation
     count = retry_remediations([remediation_id])
     assert count == 1
+    get_db().expire_all()
 
     # verify the remediation was reset to NEW
     remediation = get_db().query(Remediation).filter(Remediation.id == remediation_id).first()
@@ -218,29 +190,16 @@ def test_retry_remediations():
 
 
 @pytest.mark.integration
-def test_retry_remediations_multiple():
+def test_retry_remediations_multiple(unique_key):
     """test retrying multiple completed remediations"""
     # create multiple completed remediations
-    target1 = RemediationTarget("custom", F_TEST, "test_value_9")
-    remediation_id1 = target1.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    target2 = RemediationTarget("custom", F_TEST, "test_value_10")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-
-    # mark both as completed
-    for rid in [remediation_id1, remediation_id2]:
-        remediation = get_db().query(Remediation).filter(Remediation.id == rid).first()
-        remediation.status = RemediationStatus.COMPLETED.value
-        remediation.result = RemediatorStatus.SUCCESS.value
-    get_db().commit()
+    remediation_id1 = queue_completed(unique_key())
+    remediation_id2 = queue_completed(unique_key())
 
     # retry both
     count = retry_remediations([remediation_id1, remediation_id2])
     assert count == 2
+    get_db().expire_all()
 
     # verify both were reset
     for rid in [remediation_id1, remediation_id2]:
@@ -250,27 +209,21 @@ def test_retry_remediations_multiple():
 
 
 @pytest.mark.integration
-def test_retry_remediations_only_completed():
+def test_retry_remediations_only_completed(unique_key):
     """test that only COMPLETED remediations are retried"""
     # create a NEW remediation
-    target1 = RemediationTarget("custom", F_TEST, "test_value_11")
+    target1 = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id1 = target1.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
 
     # create a COMPLETED remediation
-    target2 = RemediationTarget("custom", F_TEST, "test_value_12")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-    remediation2 = get_db().query(Remediation).filter(Remediation.id == remediation_id2).first()
-    remediation2.status = RemediationStatus.COMPLETED.value
-    remediation2.result = RemediatorStatus.SUCCESS.value
-    get_db().commit()
+    remediation_id2 = queue_completed(unique_key())
 
     # try to retry both
     count = retry_remediations([remediation_id1, remediation_id2])
     assert count == 2
+    get_db().expire_all()
 
     # verify only the COMPLETED one was actually reset
     remediation1 = get_db().query(Remediation).filter(Remediation.id == remediation_id1).first()
@@ -281,18 +234,11 @@ def test_retry_remediations_only_completed():
 
 
 @pytest.mark.integration
-def test_restore_remediations():
+def test_restore_remediations(unique_key):
     """test restoring completed REMOVE remediations"""
     # create a completed REMOVE remediation
-    target = RemediationTarget("custom", F_TEST, "test_value_13")
-    remediation_id = target.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id, "restore_key_1"
-    )
-
-    remediation = get_db().query(Remediation).filter(Remediation.id == remediation_id).first()
-    remediation.status = RemediationStatus.COMPLETED.value
-    remediation.result = RemediatorStatus.SUCCESS.value
-    get_db().commit()
+    key = unique_key()
+    remediation_id = queue_completed(key, restore_key="restore_key_1")
 
     # count existing remediations
     initial_count = get_db().query(Remediation).count()
@@ -312,7 +258,7 @@ def test_restore_remediations():
         .filter(
             Remediation.action == RemediationAction.RESTORE.value,
             Remediation.type == F_TEST,
-            Remediation.key == "test_value_13",
+            Remediation.key == key,
         )
         .first()
     )
@@ -321,33 +267,19 @@ def test_restore_remediations():
 
 
 @pytest.mark.integration
-def test_restore_remediations_filters():
+def test_restore_remediations_filters(unique_key):
     """test that only completed REMOVE remediations with SUCCESS result are restored"""
     # create a REMOVE remediation that is NEW
-    target1 = RemediationTarget("custom", F_TEST, "test_value_14")
+    target1 = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id1 = target1.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
 
     # create a REMOVE remediation that is COMPLETED but FAILED
-    target2 = RemediationTarget("custom", F_TEST, "test_value_15")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
-    )
-    remediation2 = get_db().query(Remediation).filter(Remediation.id == remediation_id2).first()
-    remediation2.status = RemediationStatus.COMPLETED.value
-    remediation2.result = RemediatorStatus.FAILED.value
-    get_db().commit()
+    remediation_id2 = queue_completed(unique_key(), result=RemediatorStatus.FAILED)
 
     # create a RESTORE remediation
-    target3 = RemediationTarget("custom", F_TEST, "test_value_16")
-    remediation_id3 = target3.queue_remediation(
-        RemediationAction.RESTORE, get_global_runtime_settings().automation_user_id
-    )
-    remediation3 = get_db().query(Remediation).filter(Remediation.id == remediation_id3).first()
-    remediation3.status = RemediationStatus.COMPLETED.value
-    remediation3.result = RemediatorStatus.SUCCESS.value
-    get_db().commit()
+    remediation_id3 = queue_completed(unique_key(), action=RemediationAction.RESTORE)
 
     initial_count = get_db().query(Remediation).count()
 
@@ -361,25 +293,11 @@ def test_restore_remediations_filters():
 
 
 @pytest.mark.integration
-def test_restore_remediations_multiple():
+def test_restore_remediations_multiple(unique_key):
     """test restoring multiple remediations"""
     # create multiple completed REMOVE remediations
-    target1 = RemediationTarget("custom", F_TEST, "test_value_17")
-    remediation_id1 = target1.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id, "restore_key_2"
-    )
-
-    target2 = RemediationTarget("custom", F_TEST, "test_value_18")
-    remediation_id2 = target2.queue_remediation(
-        RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id, "restore_key_3"
-    )
-
-    # mark both as completed with success
-    for rid in [remediation_id1, remediation_id2]:
-        remediation = get_db().query(Remediation).filter(Remediation.id == rid).first()
-        remediation.status = RemediationStatus.COMPLETED.value
-        remediation.result = RemediatorStatus.SUCCESS.value
-    get_db().commit()
+    remediation_id1 = queue_completed(unique_key(), restore_key="restore_key_2")
+    remediation_id2 = queue_completed(unique_key(), restore_key="restore_key_3")
 
     initial_count = get_db().query(Remediation).count()
 
@@ -393,10 +311,10 @@ def test_restore_remediations_multiple():
 
 
 @pytest.mark.integration
-def test_delete_remediations():
+def test_delete_remediations(unique_key):
     """test deleting remediations"""
     # create a remediation
-    target = RemediationTarget("custom", F_TEST, "test_value_19")
+    target = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id = target.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
@@ -415,15 +333,15 @@ def test_delete_remediations():
 
 
 @pytest.mark.integration
-def test_delete_remediations_multiple():
+def test_delete_remediations_multiple(unique_key):
     """test deleting multiple remediations"""
     # create multiple remediations
-    target1 = RemediationTarget("custom", F_TEST, "test_value_20")
+    target1 = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id1 = target1.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
 
-    target2 = RemediationTarget("custom", F_TEST, "test_value_21")
+    target2 = RemediationTarget("custom", F_TEST, unique_key())
     remediation_id2 = target2.queue_remediation(
         RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id
     )
@@ -507,51 +425,49 @@ def test_mass_remediate_targets_invalid_observable():
 
 
 @pytest.mark.integration
-def test_get_distinct_remediator_names():
+def test_get_distinct_remediator_names(unique_key):
     """test getting distinct remediator names"""
     # initially should be empty
     names = get_distinct_remediator_names()
     assert names == []
 
     # create remediations with different remediator names
-    target1 = RemediationTarget("remediator_a", F_TEST, "test_value_22")
+    target1 = RemediationTarget("remediator_a", F_TEST, unique_key())
     target1.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
-    target2 = RemediationTarget("remediator_b", F_TEST, "test_value_23")
+    target2 = RemediationTarget("remediator_b", F_TEST, unique_key())
     target2.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
-    target3 = RemediationTarget("remediator_a", F_TEST, "test_value_24")
+    target3 = RemediationTarget("remediator_a", F_TEST, unique_key())
     target3.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
     # get distinct names
     names = get_distinct_remediator_names()
     assert len(names) == 2
-    assert "remediator_a" in names
-    assert "remediator_b" in names
+    assert set(names) == {"remediator_a", "remediator_b"}
 
 
 @pytest.mark.integration
-def test_get_distinct_remediation_types():
+def test_get_distinct_remediation_types(unique_key):
     """test getting distinct remediation types"""
     # initially should be empty
     types = get_distinct_remediation_types()
     assert types == []
 
     # create remediations with different types
-    target1 = RemediationTarget("custom", F_TEST, "test_value_25")
+    target1 = RemediationTarget("custom", F_TEST, unique_key())
     target1.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
     target2 = RemediationTarget("custom", F_IPV4, "192.168.1.2")
     target2.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
-    target3 = RemediationTarget("custom", F_TEST, "test_value_26")
+    target3 = RemediationTarget("custom", F_TEST, unique_key())
     target3.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
     # get distinct types
     types = get_distinct_remediation_types()
     assert len(types) == 2
-    assert F_TEST in types
-    assert F_IPV4 in types
+    assert set(types) == {F_TEST, F_IPV4}
 
 
 @pytest.mark.unit
@@ -559,8 +475,7 @@ def test_get_distinct_remediation_actions():
     """test getting distinct remediation actions"""
     actions = get_distinct_remediation_actions()
     assert len(actions) == 2
-    assert RemediationAction.REMOVE.value in actions
-    assert RemediationAction.RESTORE.value in actions
+    assert set(actions) == {RemediationAction.REMOVE.value, RemediationAction.RESTORE.value}
 
 
 @pytest.mark.unit
@@ -568,12 +483,14 @@ def test_get_distinct_remediator_statuses():
     """test getting distinct remediator statuses"""
     statuses = get_distinct_remediator_statuses()
     assert len(statuses) == 6
-    assert RemediatorStatus.DELAYED.value in statuses
-    assert RemediatorStatus.ERROR.value in statuses
-    assert RemediatorStatus.FAILED.value in statuses
-    assert RemediatorStatus.IGNORE.value in statuses
-    assert RemediatorStatus.SUCCESS.value in statuses
-    assert RemediatorStatus.CANCELLED.value in statuses
+    assert set(statuses) == {
+        RemediatorStatus.DELAYED.value,
+        RemediatorStatus.ERROR.value,
+        RemediatorStatus.FAILED.value,
+        RemediatorStatus.IGNORE.value,
+        RemediatorStatus.SUCCESS.value,
+        RemediatorStatus.CANCELLED.value,
+    }
 
 
 @pytest.mark.unit
@@ -581,16 +498,18 @@ def test_get_distinct_remediation_statuses():
     """test getting distinct remediation statuses"""
     statuses = get_distinct_remediation_statuses()
     assert len(statuses) == 3
-    assert RemediationStatus.NEW.value in statuses
-    assert RemediationStatus.IN_PROGRESS.value in statuses
-    assert RemediationStatus.COMPLETED.value in statuses
+    assert set(statuses) == {
+        RemediationStatus.NEW.value,
+        RemediationStatus.IN_PROGRESS.value,
+        RemediationStatus.COMPLETED.value,
+    }
 
 
 @pytest.mark.integration
-def test_get_distinct_analyst_names():
+def test_get_distinct_analyst_names(unique_key):
     """test getting distinct analyst names from remediations"""
     # create a remediation with the automation user
-    target = RemediationTarget("custom", F_TEST, "test_value_27")
+    target = RemediationTarget("custom", F_TEST, unique_key())
     target.queue_remediation(RemediationAction.REMOVE, get_global_runtime_settings().automation_user_id)
 
     # get analyst names
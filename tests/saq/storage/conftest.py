@@ -0,0 +1,20 @@
+import pytest
+
+from saq.storage.local import LocalStorage
+
+
+@pytest.fixture(scope="session")
+def sample_bytes():
+    return b"data"
+
+
+@pytest.fixture(scope="session")
+def readonly_storage(tmp_path_factory, sample_bytes):
+    """A LocalStorage populated once per session. Tests using this must not modify it."""
+    storage = LocalStorage(base_dir=tmp_path_factory.mktemp("readonly_storage"))
+    storage._seed("bucket", {
+        "file1.txt": sample_bytes,
+        "dir/file2.txt": sample_bytes,
+        "dir/sub/file3.txt": sample_bytes,
+    })
+    return storage
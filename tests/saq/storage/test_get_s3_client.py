@@ -1,84 +1,161 @@
 """Tests for the get_s3_client function."""
 
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
 pytest.importorskip("boto3")
 
-from saq.storage.s3 import get_s3_client
+from saq.storage.s3 import get_s3_client, reset_s3_clients
 
 
-pytestmark = pytest.mark.unit
+# boto3 and get_config are patched per test (see the _patches fixture) and the client
+# cache is reset around every test, so these tests are safe to distribute with pytest-xdist
+pytestmark = [pytest.mark.unit, pytest.mark.xdist_group("s3_client")]
 
 
+@dataclass(frozen=True, slots=True)
+class _S3Cfg:
+    """Stand-in for the s3 configuration section."""
+    host: str
+    port: int
+    access_key: str
+    secret_key: str
+    secure: bool
+    cert_check: bool
+    region: Optional[str]
+
+
+@pytest.fixture(autouse=True)
+def reset_client_cache():
+    """Keeps clients created with a mocked boto3 from leaking into (or out of) these tests."""
+    reset_s3_clients()
+    yield
+    reset_s3_clients()
+
+
+@pytest.fixture
+def _patches(request, monkeypatch):
+    """Patches boto3 and get_config, exposing the mocks as mock_boto3 and mock_get_config on the test class instance."""
+    request.instance.mock_boto3 = MagicMock()
+    request.instance.mock_get_config = MagicMock()
+    monkeypatch.setattr("saq.storage.s3.boto3", request.instance.mock_boto3)
+    monkeypatch.setattr("saq.storage.s3.get_config", request.instance.mock_get_config)
+
+
+@pytest.mark.usefixtures("_patches")
 class TestGetS3ClientAWSNative:
     """Tests for the AWS-native path when no self-hosted S3 config is present."""
 
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_returns_boto3_client_with_region(self, mock_get_config, mock_boto3):
+    def test_returns_boto3_client_with_region(self):
         """When get_config().s3 is None, creates a boto3 client with just the region."""
-        mock_get_config.return_value.s3 = None
+        self.mock_get_config.return_value.s3 = None
         mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
+        self.mock_boto3.client.return_value = mock_client
 
         result = get_s3_client(region="us-east-2")
 
-        mock_boto3.client.assert_called_once_with("s3", region_name="us-east-2")
+        self.mock_boto3.client.assert_called_once()
+        call_args = self.mock_boto3.client.call_args
+        assert call_args.args == ("s3",)
+        assert call_args.kwargs["region_name"] == "us-east-2"
         assert result is mock_client
 
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_returns_boto3_client_without_region(self, mock_get_config, mock_boto3):
+    def test_returns_boto3_client_without_region(self):
         """When get_config().s3 is None and no region provided, creates client with region_name=None."""
-        mock_get_config.return_value.s3 = None
+        self.mock_get_config.return_value.s3 = None
         mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
+        self.mock_boto3.client.return_value = mock_client
 
         result = get_s3_client()
 
-        mock_boto3.client.assert_called_once_with("s3", region_name=None)
+        self.mock_boto3.client.assert_called_once()
+        call_args = self.mock_boto3.client.call_args
+        assert call_args.args == ("s3",)
+        assert call_args.kwargs["region_name"] is None
         assert result is mock_client
 
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_does_not_pass_endpoint_or_credentials(self, mock_get_config, mock_boto3):
+    def test_does_not_pass_endpoint_or_credentials(self):
         """AWS-native path should not pass endpoint_url, access key, or secret key."""
-        mock_get_config.return_value.s3 = None
+        self.mock_get_config.return_value.s3 = None
 
         get_s3_client(region="us-west-1")
 
-        call_kwargs = mock_boto3.client.call_args
-        assert "endpoint_url" not in call_kwargs.kwargs
-        assert "aws_access_key_id" not in call_kwargs.kwargs
-        assert "aws_secret_access_key" not in call_kwargs.kwargs
+        self.mock_boto3.client.assert_called_once()
+        call_kwargs = self.mock_boto3.client.call_args.kwargs
+        assert "endpoint_url" not in call_kwargs
+        assert "aws_access_key_id" not in call_kwargs
+        assert "aws_secret_access_key" not in call_kwargs
+
+    def test_configures_connection_pool(self, monkeypatch):
+        """The client is created with a larger connection pool and standard retries."""
+        monkeypatch.delenv("BOTO_MAX_POOL_CONNECTIONS", raising=False)
+        self.mock_get_config.return_value.s3 = None
+
+        get_s3_client(region="us-east-2")
+
+        config = self.mock_boto3.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.retries == {"max_attempts": 3, "mode": "standard"}
+
+    def test_connection_pool_size_from_environment(self, monkeypatch):
+        """BOTO_MAX_POOL_CONNECTIONS overrides the default connection pool size."""
+        monkeypatch.setenv("BOTO_MAX_POOL_CONNECTIONS", "5")
+        self.mock_get_config.return_value.s3 = None
+
+        get_s3_client(region="us-east-2")
+
+        assert self.mock_boto3.client.call_args.kwargs["config"].max_pool_connections == 5
+
+    def test_client_is_cached_per_region(self):
+        """Repeated calls with the same region reuse the same client."""
+        self.mock_get_config.return_value.s3 = None
+        self.mock_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = get_s3_client(region="us-east-2")
+        assert get_s3_client(region="us-east-2") is first
+        assert get_s3_client(region="us-west-1") is not first
+        assert self.mock_boto3.client.call_count == 2
+
+    def test_clients_are_not_shared_after_fork(self, monkeypatch):
+        """Clients created by another process (before a fork) are not reused."""
+        self.mock_get_config.return_value.s3 = None
+        self.mock_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = get_s3_client(region="us-east-2")
+        # pretend the cached clients were created by the parent process
+        monkeypatch.setattr("saq.storage.s3._global_s3_clients_pid", -1)
+        assert get_s3_client(region="us-east-2") is not first
+        assert self.mock_boto3.client.call_count == 2
 
 
+@pytest.mark.usefixtures("_patches")
 class TestGetS3ClientSelfHosted:
     """Tests for the self-hosted S3-compatible path when S3 config is present."""
 
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_returns_client_with_explicit_endpoint_and_credentials(self, mock_get_config, mock_boto3):
+    def test_returns_client_with_explicit_endpoint_and_credentials(self):
         """When get_config().s3 exists, creates a client with explicit endpoint and credentials."""
-        mock_s3_config = MagicMock()
-        mock_s3_config.host = "minio.local"
-        mock_s3_config.port = 9000
-        mock_s3_config.access_key = "test-access-key"
-        mock_s3_config.secret_key = "test-secret-key"
-        mock_s3_config.secure = False
-        mock_s3_config.cert_check = False
-        mock_s3_config.region = "us-east-1"
-        mock_get_config.return_value.s3 = mock_s3_config
+        self.mock_get_config.return_value.s3 = _S3Cfg(
+            host="minio.local",
+            port=9000,
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            secure=False,
+            cert_check=False,
+            region="us-east-1",
+        )
 
         mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
+        self.mock_boto3.client.return_value = mock_client
 
         result = get_s3_client()
 
-        call_kwargs = mock_boto3.client.call_args.kwargs
-        assert mock_boto3.client.call_args.args == ("s3",)
+        self.mock_boto3.client.assert_called_once()
+        call_args = self.mock_boto3.client.call_args
+        call_kwargs = call_args.kwargs
+        assert call_args.args == ("s3",)
         assert call_kwargs["endpoint_url"] == "http://minio.local:9000"
         assert call_kwargs["aws_access_key_id"] == "test-access-key"
         assert call_kwargs["aws_secret_access_key"] == "test-secret-key"
@@ -90,40 +167,38 @@ class TestGetS3ClientSelfHosted:
         (True, "https"),
         (False, "http"),
     ])
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_uses_correct_protocol(self, mock_get_config, mock_boto3, secure, expected_protocol):
+    def test_uses_correct_protocol(self, secure, expected_protocol):
         """Endpoint URL protocol should match the secure setting."""
-        mock_s3_config = MagicMock()
-        mock_s3_config.host = "s3.local"
-        mock_s3_config.port = 9000
-        mock_s3_config.access_key = "key"
-        mock_s3_config.secret_key = "secret"
-        mock_s3_config.secure = secure
-        mock_s3_config.cert_check = True
-        mock_s3_config.region = None
-        mock_get_config.return_value.s3 = mock_s3_config
+        self.mock_get_config.return_value.s3 = _S3Cfg(
+            host="s3.local",
+            port=9000,
+            access_key="key",
+            secret_key="secret",
+            secure=secure,
+            cert_check=True,
+            region=None,
+        )
 
         get_s3_client()
 
-        call_kwargs = mock_boto3.client.call_args.kwargs
+        self.mock_boto3.client.assert_called_once()
+        call_kwargs = self.mock_boto3.client.call_args.kwargs
         assert call_kwargs["endpoint_url"] == f"{expected_protocol}://s3.local:9000"
 
-    @patch("saq.storage.s3.boto3")
-    @patch("saq.storage.s3.get_config")
-    def test_region_parameter_ignored_when_self_hosted(self, mock_get_config, mock_boto3):
+    def test_region_parameter_ignored_when_self_hosted(self):
         """When self-hosted config exists, the region parameter is ignored in favor of config region."""
-        mock_s3_config = MagicMock()
-        mock_s3_config.host = "s3.local"
-        mock_s3_config.port = 9000
-        mock_s3_config.access_key = "key"
-        mock_s3_config.secret_key = "secret"
-        mock_s3_config.secure = False
-        mock_s3_config.cert_check = False
-        mock_s3_config.region = "config-region"
-        mock_get_config.return_value.s3 = mock_s3_config
+        self.mock_get_config.return_value.s3 = _S3Cfg(
+            host="s3.local",
+            port=9000,
+            access_key="key",
+            secret_key="secret",
+            secure=False,
+            cert_check=False,
+            region="config-region",
+        )
 
         get_s3_client(region="ignored-region")
 
-        call_kwargs = mock_boto3.client.call_args.kwargs
+        self.mock_boto3.client.assert_called_once()
+        call_kwargs = self.mock_boto3.client.call_args.kwargs
         assert call_kwargs["region_name"] == "config-region"
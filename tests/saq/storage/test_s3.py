@@ -6,20 +6,27 @@ S3-compatible storage connections and operations. Each test uses a unique bucket
 name to avoid conflicts with the main system which uses 'ace3'.
 """
 
+import io
 import os
 import pytest
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 from pathlib import Path
 
 pytest.importorskip("boto3")
 
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
 from saq.configuration.config import get_config
-from saq.storage.s3 import S3Storage
+from saq.storage.s3 import DEFAULT_TRANSFER_IO_CHUNKSIZE, DEFAULT_TRANSFER_MAX_CONCURRENCY, S3Storage
 from saq.storage.error import StorageError
 
-pytestmark = pytest.mark.integration
+# clean_test_bucket sweeps the whole shared bucket, so with --dist loadgroup every test
+# in this module runs on the same worker while other modules run in parallel
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("s3")]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def s3_config():
     """Get S3 configuration from the system config."""
     config = get_config().s3
@@ -35,45 +42,125 @@ def s3_config():
     }
 
 
-@pytest.fixture(autouse=True)
-def clean_test_bucket(s3_config):
+@pytest.fixture(scope="session")
+def storage(s3_config):
+    """A single S3 storage instance (and boto3 client) shared by all tests."""
+    return S3Storage(**s3_config)
+
+
+@pytest.fixture(scope="session")
+def shared_upload_file(tmp_path_factory):
+    """A local file written once per session that tests upload under their own remote paths.
+    Returns the path to the file and its content."""
+    payload = tmp_path_factory.mktemp("s3data") / "payload.txt"
+    payload.write_bytes(b"This is test content for S3 storage testing.")
+    return str(payload), payload.read_text()
+
+# number of concurrent delete requests used when cleaning the test bucket
+CLEANUP_MAX_WORKERS = 16
+
+# number of concurrent uploads/downloads used by the integration tests
+TRANSFER_MAX_WORKERS = 8
+
+# the maximum number of keys accepted by a single DeleteObjects request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+
+def delete_objects_batch(storage: S3Storage, bucket: str, keys: list[str]):
+    """Delete up to DELETE_OBJECTS_MAX_KEYS keys with a single DeleteObjects request.
+    Fails the test if any key could not be deleted."""
+    response = storage.client.delete_objects(
+        Bucket=bucket,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True})
+
+    # in quiet mode per-key failures are only reported in Errors, the request itself does not fail
+    errors = response.get("Errors", [])
+    if errors:
+        failed = [f"{error['Key']} ({error.get('Code')}: {error.get('Message')})" for error in errors]
+        pytest.fail(f"failed to delete {len(errors)} objects from {bucket}: {failed}")
+
+
+def _bucket_is_empty(storage: S3Storage, bucket: str, prefix: str = "") -> tuple[bool, list[str]]:
+    """Check whether the bucket has any objects (under prefix) with a single request.
+    Returns the emptiness flag and the keys that were seen, for use in failure messages.
+    A bucket that does not exist yet (it is created on first upload) counts as empty."""
+    try:
+        response = storage.client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=1)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchBucket":
+            return True, []
+        raise
+
+    keys = [obj["Key"] for obj in response.get("Contents", [])]
+    return response.get("KeyCount", 0) == 0, keys
+
+
+def _cleanup_bucket(storage: S3Storage, bucket: str, executor: ThreadPoolExecutor, prefix: str = ""):
+    """Remove all objects (under prefix) from the given bucket in batches of DeleteObjects requests."""
+    # the bucket is usually already clean, which only costs this single request
+    is_empty, _ = _bucket_is_empty(storage, bucket, prefix)
+    if is_empty:
+        return
+
+    objects = iter(storage.list_objects(bucket, prefix=prefix, recursive=True))
+
+    futures = []
+    while chunk := list(itertools.islice(objects, DELETE_OBJECTS_MAX_KEYS)):
+        futures.append(executor.submit(delete_objects_batch, storage, bucket, chunk))
+
+    for future in futures:
+        try:
+            future.result()
+        except ClientError:
+            pass
+
+
+# set ACE3_STRICT_S3_CLEANUP to verify that the test bucket really is empty before and after the tests
+STRICT_S3_CLEANUP = bool(os.environ.get("ACE3_STRICT_S3_CLEANUP"))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def clean_test_bucket(storage):
     """
-    Automatically clean the ace3test bucket before and after each test.
+    Clean the ace3test bucket before and after the tests in this module.
+    Objects created by each test are removed by clean_prefix.
+    Yields the executor used to delete objects.
     """
-    storage = S3Storage(**s3_config)
     test_bucket = "ace3test"
 
-    def cleanup_bucket():
-        """Remove all objects from the test bucket."""
-        try:
-            objects = storage.list_objects(test_bucket, recursive=True)
-            for obj in objects:
-                try:
-                    storage.delete_object(test_bucket, obj)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+        _cleanup_bucket(storage, test_bucket, executor)
 
-    cleanup_bucket()
+        if STRICT_S3_CLEANUP:
+            is_empty, objects = _bucket_is_empty(storage, test_bucket)
+            if not is_empty:
+                pytest.fail(f"ace3test bucket was not empty before tests. Found objects: {objects}")
 
-    try:
-        objects = storage.list_objects(test_bucket, recursive=True)
-        if objects:
-            pytest.fail(f"ace3test bucket was not empty before test. Found objects: {objects}")
-    except Exception:
-        pass
+        yield executor
 
-    yield
+        _cleanup_bucket(storage, test_bucket, executor)
 
-    cleanup_bucket()
+        if STRICT_S3_CLEANUP:
+            is_empty, objects = _bucket_is_empty(storage, test_bucket)
+            if not is_empty:
+                pytest.fail(f"ace3test bucket was not cleaned after tests. Found objects: {objects}")
 
-    try:
-        objects = storage.list_objects(test_bucket, recursive=True)
-        if objects:
-            pytest.fail(f"ace3test bucket was not cleaned after test. Found objects: {objects}")
-    except Exception:
-        pass
+
+# prefixes only need to be unique within a test run
+_prefix_counter = itertools.count()
+
+
+@pytest.fixture
+def unique_prefix():
+    """Generate a unique prefix for test objects within the bucket."""
+    return f"test-{next(_prefix_counter):08x}"
+
+
+@pytest.fixture(autouse=True)
+def clean_prefix(storage, clean_test_bucket, unique_prefix):
+    """Remove the objects the test created under its unique prefix."""
+    yield
+    _cleanup_bucket(storage, "ace3test", clean_test_bucket, prefix=f"{unique_prefix}/")
 
 
 class TestS3StorageInitialization:
@@ -97,6 +184,16 @@ class TestS3StorageInitialization:
         assert storage.endpoint == f"{s3_config['host']}:{s3_config['port']}"
         assert storage.client is not None
 
+    def test_init_transfer_config(self, s3_config):
+        """Test that a default transfer config is used unless one is given."""
+        storage = S3Storage(**s3_config)
+        assert storage.transfer_config.max_concurrency == DEFAULT_TRANSFER_MAX_CONCURRENCY
+        assert storage.transfer_config.io_chunksize == DEFAULT_TRANSFER_IO_CHUNKSIZE
+
+        transfer_config = TransferConfig(max_concurrency=2)
+        storage = S3Storage(**s3_config, transfer_config=transfer_config)
+        assert storage.transfer_config is transfer_config
+
     def test_init_with_secure_connection(self, s3_config):
         """Test initialization with secure=True."""
         storage = S3Storage(
@@ -109,16 +206,15 @@ class TestS3StorageInitialization:
 
         assert storage.secure is True
 
-    def test_init_missing_credentials_raises_error(self, s3_config):
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"access_key": "test"},
+        {"secret_key": "test"},
+    ], ids=["no_credentials", "access_key_only", "secret_key_only"])
+    def test_init_missing_credentials_raises_error(self, s3_config, kwargs):
         """Test that missing credentials raise ValueError."""
         with pytest.raises(ValueError, match="access key and secret key must be provided"):
-            S3Storage(host=s3_config["host"], port=s3_config["port"])
-
-        with pytest.raises(ValueError, match="access key and secret key must be provided"):
-            S3Storage(host=s3_config["host"], port=s3_config["port"], access_key="test")
-
-        with pytest.raises(ValueError, match="access key and secret key must be provided"):
-            S3Storage(host=s3_config["host"], port=s3_config["port"], secret_key="test")
+            S3Storage(host=s3_config["host"], port=s3_config["port"], **kwargs)
 
     def test_init_with_custom_config(self, s3_config):
         """Test initialization with custom configuration."""
@@ -137,28 +233,15 @@ class TestS3StorageInitialization:
 class TestS3StorageFileOperations:
     """Test file upload and download operations."""
 
-    @pytest.fixture
-    def storage(self, s3_config):
-        """Create an S3 storage instance for testing."""
-        return S3Storage(**s3_config)
-
     @pytest.fixture
     def test_bucket(self):
         """Use the ace3test bucket for all tests."""
         return "ace3test"
 
     @pytest.fixture
-    def unique_prefix(self):
-        """Generate a unique prefix for test objects within the bucket."""
-        return f"test-{uuid.uuid4().hex[:8]}"
-
-    @pytest.fixture
-    def test_file(self, tmpdir):
-        """Create a test file for upload/download operations."""
-        test_content = "This is test content for S3 storage testing."
-        test_file = tmpdir.join("test_file.txt")
-        test_file.write(test_content)
-        return str(test_file), test_content
+    def test_file(self, shared_upload_file):
+        """The test file used for upload/download operations."""
+        return shared_upload_file
 
     def test_upload_file_success(self, storage, test_bucket, unique_prefix, test_file):
         """Test successful file upload."""
@@ -174,16 +257,28 @@ class TestS3StorageFileOperations:
 
         storage.delete_object(test_bucket, remote_path)
 
+    def test_upload_fileobj_success(self, storage, test_bucket, unique_prefix, tmp_path):
+        """Test uploading from an in-memory file object."""
+        remote_path = f"{unique_prefix}/fileobj.txt"
+        download_path = str(tmp_path / "fileobj.txt")
+
+        url = storage.upload_fileobj(io.BytesIO(b"in memory content"), test_bucket, remote_path)
+        assert url == f"http://{storage.host}:{storage.port}/{test_bucket}/{remote_path}"
+
+        storage.download_file(test_bucket, remote_path, download_path)
+        with open(download_path, 'rb') as f:
+            assert f.read() == b"in memory content"
+
     def test_upload_file_nonexistent_source(self, storage, test_bucket, unique_prefix):
         """Test upload with non-existent source file."""
         with pytest.raises(FileNotFoundError, match="source file not found"):
             storage.upload_file("/nonexistent/file.txt", test_bucket, f"{unique_prefix}/remote.txt")
 
-    def test_download_file_success(self, storage, test_bucket, unique_prefix, test_file, tmpdir):
+    def test_download_file_success(self, storage, test_bucket, unique_prefix, test_file, tmp_path):
         """Test successful file download."""
         local_path, expected_content = test_file
         remote_path = f"{unique_prefix}/downloaded_file.txt"
-        download_path = str(tmpdir.join("downloaded.txt"))
+        download_path = str(tmp_path / "downloaded.txt")
 
         storage.upload_file(local_path, test_bucket, remote_path)
 
@@ -195,18 +290,18 @@ class TestS3StorageFileOperations:
 
         storage.delete_object(test_bucket, remote_path)
 
-    def test_download_file_nonexistent_remote(self, storage, test_bucket, unique_prefix, tmpdir):
+    def test_download_file_nonexistent_remote(self, storage, test_bucket, unique_prefix, tmp_path):
         """Test download with non-existent remote file."""
-        download_path = str(tmpdir.join("downloaded.txt"))
+        download_path = str(tmp_path / "downloaded.txt")
 
         with pytest.raises(FileNotFoundError, match="file not found in storage"):
             storage.download_file(test_bucket, f"{unique_prefix}/nonexistent.txt", download_path)
 
-    def test_download_file_creates_local_directory(self, storage, test_bucket, unique_prefix, test_file, tmpdir):
+    def test_download_file_creates_local_directory(self, storage, test_bucket, unique_prefix, test_file, tmp_path):
         """Test that download creates local directory if needed."""
         local_path, _ = test_file
         remote_path = f"{unique_prefix}/test.txt"
-        nested_download_path = str(tmpdir.join("nested", "dir", "downloaded.txt"))
+        nested_download_path = str(tmp_path / "nested" / "dir" / "downloaded.txt")
 
         storage.upload_file(local_path, test_bucket, remote_path)
 
@@ -216,14 +311,13 @@ class TestS3StorageFileOperations:
 
         storage.delete_object(test_bucket, remote_path)
 
-    def test_upload_download_with_pathlib_path(self, storage, test_bucket, unique_prefix, tmpdir):
+    def test_upload_download_with_pathlib_path(self, storage, test_bucket, unique_prefix, test_file, tmp_path):
         """Test upload and download using pathlib.Path objects."""
-        test_content = "Testing with pathlib.Path"
-        local_path = Path(tmpdir) / "path_test.txt"
-        local_path.write_text(test_content)
+        local_path, test_content = test_file
+        local_path = Path(local_path)
 
         remote_path = f"{unique_prefix}/pathlib_test.txt"
-        download_path = Path(tmpdir) / "downloaded_pathlib.txt"
+        download_path = tmp_path / "downloaded_pathlib.txt"
 
         storage.upload_file(local_path, test_bucket, remote_path)
 
@@ -237,23 +331,21 @@ class TestS3StorageFileOperations:
 class TestS3StorageBucketOperations:
     """Test bucket listing and management operations."""
 
-    @pytest.fixture
-    def storage(self, s3_config):
-        """Create an S3 storage instance for testing."""
-        return S3Storage(**s3_config)
+    @pytest.fixture(scope="class")
+    def bucket_list(self, storage):
+        """The buckets that exist before any of the tests in this class run."""
+        return storage.list_buckets()
 
-    def test_list_buckets(self, storage):
+    def test_list_buckets(self, bucket_list):
         """Test listing all buckets."""
-        buckets = storage.list_buckets()
-        assert isinstance(buckets, list)
-        assert "ace3test" in buckets
+        assert isinstance(bucket_list, list)
+        assert "ace3test" in bucket_list
 
-    def test_ensure_bucket_exists_with_existing_bucket(self, storage):
+    def test_ensure_bucket_exists_with_existing_bucket(self, storage, bucket_list):
         """Test that _ensure_bucket_exists works with existing bucket."""
         test_bucket = "ace3test"
 
-        buckets = storage.list_buckets()
-        assert test_bucket in buckets
+        assert test_bucket in bucket_list
 
         storage._ensure_bucket_exists(test_bucket)
 
@@ -274,46 +366,28 @@ class TestS3StorageBucketOperations:
 class TestS3StorageObjectOperations:
     """Test object listing, existence checking, and metadata operations."""
 
-    @pytest.fixture
-    def storage(self, s3_config):
-        """Create an S3 storage instance for testing."""
-        return S3Storage(**s3_config)
-
     @pytest.fixture
     def test_bucket(self):
         """Use the ace3test bucket for all tests."""
         return "ace3test"
 
     @pytest.fixture
-    def unique_prefix(self):
-        """Generate a unique prefix for test objects within the bucket."""
-        return f"test-{uuid.uuid4().hex[:8]}"
-
-    @pytest.fixture
-    def test_objects(self, storage, test_bucket, unique_prefix, tmpdir):
+    def test_objects(self, storage, test_bucket, unique_prefix, shared_upload_file):
         """Create test objects in the bucket."""
-        objects = []
-
-        for i, name in enumerate(["file1.txt", "folder/file2.txt", "folder/subfolder/file3.txt"]):
-            content = f"Test content {i+1}"
-            temp_file = tmpdir.join(f"temp_{i}.txt")
-            temp_file.write(content)
+        _, content = shared_upload_file
+        data = content.encode()
+        objects = [f"{unique_prefix}/{name}" for name in ["file1.txt", "folder/file2.txt", "folder/subfolder/file3.txt"]]
 
-            remote_name = f"{unique_prefix}/{name}"
-            storage.upload_file(str(temp_file), test_bucket, remote_name)
-            objects.append(remote_name)
+        with ThreadPoolExecutor(max_workers=len(objects)) as executor:
+            list(executor.map(lambda remote_name: storage.upload_fileobj(io.BytesIO(data), test_bucket, remote_name), objects))
 
         yield objects
 
-        for obj in objects:
-            try:
-                storage.delete_object(test_bucket, obj)
-            except: # noqa: E722
-                pass
+        delete_objects_batch(storage, test_bucket, objects)
 
     def test_list_objects_recursive(self, storage, test_bucket, unique_prefix, test_objects):
         """Test listing objects recursively."""
-        objects = storage.list_objects(test_bucket, prefix=unique_prefix, recursive=True)
+        objects = storage.list_objects(test_bucket, prefix=unique_prefix, recursive=True, max_keys=4)
 
         assert isinstance(objects, list)
         assert len(objects) == 3
@@ -323,7 +397,7 @@ class TestS3StorageObjectOperations:
 
     def test_list_objects_with_prefix(self, storage, test_bucket, unique_prefix, test_objects):
         """Test listing objects with prefix filter."""
-        objects = storage.list_objects(test_bucket, prefix=f"{unique_prefix}/folder/")
+        objects = storage.list_objects(test_bucket, prefix=f"{unique_prefix}/folder/", max_keys=3)
 
         assert isinstance(objects, list)
         assert len(objects) == 2
@@ -333,7 +407,7 @@ class TestS3StorageObjectOperations:
 
     def test_list_objects_nonrecursive(self, storage, test_bucket, unique_prefix, test_objects):
         """Test listing objects non-recursively."""
-        objects = storage.list_objects(test_bucket, prefix=f"{unique_prefix}/", recursive=False)
+        objects = storage.list_objects(test_bucket, prefix=f"{unique_prefix}/", recursive=False, max_keys=3)
 
         assert isinstance(objects, list)
         assert len(objects) == 2
@@ -341,6 +415,13 @@ class TestS3StorageObjectOperations:
         assert f"{unique_prefix}/folder/subfolder/file3.txt" not in objects
         assert f"{unique_prefix}/file1.txt" in objects
 
+    def test_list_objects_max_keys(self, storage, test_bucket, unique_prefix, test_objects):
+        """Test that max_keys limits the number of objects returned."""
+        objects = storage.list_objects(test_bucket, prefix=unique_prefix, max_keys=2)
+
+        assert len(objects) == 2
+        assert set(objects) <= set(test_objects)
+
     def test_object_exists_true(self, storage, test_bucket, unique_prefix, test_objects):
         """Test object_exists returns True for existing object."""
         assert storage.object_exists(test_bucket, f"{unique_prefix}/file1.txt") is True
@@ -369,10 +450,10 @@ class TestS3StorageObjectOperations:
         info = storage.get_object_info(test_bucket, f"{unique_prefix}/nonexistent.txt")
         assert info is None
 
-    def test_delete_object_success(self, storage, test_bucket, unique_prefix, tmpdir):
+    def test_delete_object_success(self, storage, test_bucket, unique_prefix, tmp_path):
         """Test successful object deletion."""
-        test_file = tmpdir.join("delete_test.txt")
-        test_file.write("delete me")
+        test_file = tmp_path / "delete_test.txt"
+        test_file.write_text("delete me")
         remote_path = f"{unique_prefix}/delete_test.txt"
 
         storage.upload_file(str(test_file), test_bucket, remote_path)
@@ -393,11 +474,6 @@ class TestS3StorageObjectOperations:
 class TestS3StorageURLGeneration:
     """Test URL generation functionality."""
 
-    @pytest.fixture
-    def storage(self, s3_config):
-        """Create an S3 storage instance for testing."""
-        return S3Storage(**s3_config)
-
     @pytest.fixture
     def secure_storage(self, s3_config):
         """Create a secure S3 storage instance for testing."""
@@ -455,23 +531,19 @@ class TestS3StorageErrorHandling:
 class TestS3StorageIntegration:
     """Integration tests that test multiple operations together."""
 
-    @pytest.fixture
-    def storage(self, s3_config):
-        """Create an S3 storage instance for testing."""
-        return S3Storage(**s3_config)
-
     @pytest.fixture
     def test_bucket(self):
         """Use the ace3test bucket for all tests."""
         return "ace3test"
 
     @pytest.fixture
-    def unique_prefix(self):
-        """Generate a unique prefix for test objects within the bucket."""
-        return f"test-{uuid.uuid4().hex[:8]}"
+    def executor(self):
+        """Thread pool used to run the per-file operations concurrently."""
+        with ThreadPoolExecutor(max_workers=TRANSFER_MAX_WORKERS) as executor:
+            yield executor
 
 
-    def test_full_lifecycle_workflow(self, storage, test_bucket, unique_prefix, tmpdir):
+    def test_full_lifecycle_workflow(self, storage, test_bucket, unique_prefix, tmp_path, executor):
         """Test a complete workflow: upload, list, download, delete."""
         files_data = [
             ("file1.txt", "Content of file 1"),
@@ -479,79 +551,85 @@ class TestS3StorageIntegration:
             ("folder/subfolder/file3.txt", "Content of file 3"),
         ]
 
-        local_files = []
-        for filename, content in files_data:
-            local_file = tmpdir.join(f"local_{filename.replace('/', '_')}")
-            local_file.write(content)
-            local_files.append((str(local_file), f"{unique_prefix}/{filename}", content))
+        remote_files = [(f"{unique_prefix}/{filename}", content) for filename, content in files_data]
+
+        def _do_upload(item):
+            remote_path, content = item
+            return storage.upload_fileobj(io.BytesIO(content.encode()), test_bucket, remote_path)
+
+        def _do_download(item):
+            remote_path, _ = item
+            download_path = str(tmp_path / f"downloaded_{remote_path.replace('/', '_').replace(unique_prefix + '_', '')}")
+            storage.download_file(test_bucket, remote_path, download_path)
+            return download_path
+
+        def _do_delete(item):
+            remote_path, _ = item
+            return storage.delete_object(test_bucket, remote_path)
 
         try:
-            for local_path, remote_path, content in local_files:
-                url = storage.upload_file(local_path, test_bucket, remote_path)
+            urls = list(executor.map(_do_upload, remote_files))
+            for url, (remote_path, _) in zip(urls, remote_files):
                 assert url.endswith(f"/{test_bucket}/{remote_path}")
 
-            objects = storage.list_objects(test_bucket, prefix=unique_prefix)
+            # a single listing covers the existence of every uploaded file
+            objects = set(storage.list_objects(test_bucket, prefix=unique_prefix, max_keys=4))
             assert len(objects) == 3
-            for _, remote_path, _ in local_files:
+            for remote_path, _ in remote_files:
                 assert remote_path in objects
 
-            for _, remote_path, _ in local_files:
-                assert storage.object_exists(test_bucket, remote_path)
-
-            for _, remote_path, content in local_files:
+            for remote_path, content in remote_files:
                 info = storage.get_object_info(test_bucket, remote_path)
                 assert info is not None
                 assert info["size"] == len(content.encode('utf-8'))
 
-            for local_path, remote_path, expected_content in local_files:
-                download_path = str(tmpdir.join(f"downloaded_{remote_path.replace('/', '_').replace(unique_prefix + '_', '')}"))
-                url = storage.download_file(test_bucket, remote_path, download_path)
-
+            download_paths = list(executor.map(_do_download, remote_files))
+            for download_path, (_, expected_content) in zip(download_paths, remote_files):
                 assert os.path.exists(download_path)
                 with open(download_path, 'r') as f:
                     assert f.read() == expected_content
 
-            for _, remote_path, _ in local_files:
-                result = storage.delete_object(test_bucket, remote_path)
-                assert result is True
-                assert storage.object_exists(test_bucket, remote_path) is False
+            results = list(executor.map(_do_delete, remote_files))
+            assert all(result is True for result in results)
 
-            objects = storage.list_objects(test_bucket, prefix=unique_prefix)
+            objects = storage.list_objects(test_bucket, prefix=unique_prefix, max_keys=1)
             assert len(objects) == 0
 
         except Exception:
-            for _, remote_path, _ in local_files:
+            for remote_path, _ in remote_files:
                 try:
                     storage.delete_object(test_bucket, remote_path)
                 except: # noqa: E722
                     pass
             raise
 
-    def test_concurrent_operations(self, storage, test_bucket, unique_prefix, tmpdir):
-        """Test that multiple operations work correctly in sequence."""
-        files_to_upload = []
-        for i in range(5):
-            content = f"Concurrent test file {i}"
-            local_file = tmpdir.join(f"concurrent_{i}.txt")
-            local_file.write(content)
-            files_to_upload.append((str(local_file), f"{unique_prefix}/concurrent_{i}.txt", content))
+    def test_concurrent_operations(self, storage, test_bucket, unique_prefix, tmp_path, executor):
+        """Test that multiple operations work correctly when run concurrently."""
+        files_to_upload = [(f"{unique_prefix}/concurrent_{i}.txt", f"Concurrent test file {i}") for i in range(5)]
+
+        def _do_upload(item):
+            remote_path, content = item
+            return storage.upload_fileobj(io.BytesIO(content.encode()), test_bucket, remote_path)
+
+        def _do_download(item):
+            remote_path, _ = item
+            download_path = str(tmp_path / f"downloaded_concurrent_{remote_path.replace('/', '_')}")
+            storage.download_file(test_bucket, remote_path, download_path)
+            return download_path
 
         try:
-            for local_path, remote_path, _ in files_to_upload:
-                storage.upload_file(local_path, test_bucket, remote_path)
+            list(executor.map(_do_upload, files_to_upload))
 
-            objects = storage.list_objects(test_bucket, prefix=unique_prefix)
+            objects = storage.list_objects(test_bucket, prefix=unique_prefix, max_keys=6)
             assert len(objects) == 5
 
-            for local_path, remote_path, expected_content in files_to_upload:
-                download_path = str(tmpdir.join(f"downloaded_concurrent_{remote_path.replace('/', '_')}"))
-                storage.download_file(test_bucket, remote_path, download_path)
-
+            download_paths = list(executor.map(_do_download, files_to_upload))
+            for download_path, (_, expected_content) in zip(download_paths, files_to_upload):
                 with open(download_path, 'r') as f:
                     assert f.read() == expected_content
 
         finally:
-            for _, remote_path, _ in files_to_upload:
+            for remote_path, _ in files_to_upload:
                 try:
                     storage.delete_object(test_bucket, remote_path)
                 except: # noqa: E722
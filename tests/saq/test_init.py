@@ -6,11 +6,19 @@ import pytest
 from saq.configuration import get_config
 from saq.configuration.schema import ACEConfig
 from saq.environment import get_global_runtime_settings, set_node
+import saq.logging
 from saq.logging import CustomFileHandler, initialize_logging
 
 @pytest.mark.unit
-def test_custom_file_handler(tmpdir, monkeypatch):
-    handler = CustomFileHandler(str(tmpdir))
+def test_custom_file_handler(monkeypatch):
+    # log files are opened as in-memory streams so nothing is written to disk
+    opened_files = []
+    def _open(path, mode):
+        opened_files.append(path)
+        return io.StringIO()
+
+    monkeypatch.setattr(saq.logging, "open", _open, raising=False)
+    handler = CustomFileHandler("/var/log/ace")
     assert isinstance(handler.filename_format, str) # should default
     assert isinstance(handler.current_filename, str) # should reference a file name after init
     assert isinstance(handler.stream, io.TextIOBase) # should be open file handle
@@ -20,6 +28,8 @@ def test_custom_file_handler(tmpdir, monkeypatch):
     # fake rotation
     handler.current_filename = None
     handler.emit(record)
+    assert len(opened_files) == 2
+    assert all(path.startswith("/var/log/ace/") for path in opened_files)
 
     # force error
     def _fail():
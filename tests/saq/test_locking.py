@@ -1,44 +1,75 @@
-import uuid
+import itertools
+import os
 import pytest
 
 from saq.database.pool import get_db_connection
 from saq.database.util.locking import acquire_lock, clear_expired_locks, release_lock
 from saq.environment import get_global_runtime_settings
 
+# lock identifiers only need to be unique within a test run
+_lock_ids = itertools.count()
+
+def _next_lock_id() -> str:
+    return f"{os.getpid()}-{next(_lock_ids)}"
+
 @pytest.mark.integration
 def test_lock():
-    first_lock_uuid = str(uuid.uuid4())
-    second_lock_uuid = str(uuid.uuid4())
-    target_lock = str(uuid.uuid4())
+    first_lock_uuid = _next_lock_id()
+    second_lock_uuid = _next_lock_id()
+    target_lock = _next_lock_id()
+    # all of the lock operations share a single connection
+    with get_db_connection() as db:
+        assert acquire_lock(target_lock, first_lock_uuid, db=db)
+        assert not acquire_lock(target_lock, second_lock_uuid, db=db)
+        assert acquire_lock(target_lock, first_lock_uuid, db=db)
+        release_lock(target_lock, first_lock_uuid, db=db)
+        assert acquire_lock(target_lock, second_lock_uuid, db=db)
+        assert not acquire_lock(target_lock, first_lock_uuid, db=db)
+        release_lock(target_lock, second_lock_uuid, db=db)
+
+@pytest.mark.integration
+def test_lock_pooled_connections():
+    # the default path checks a connection out of the pool for every call
+    lock_uuid = _next_lock_id()
+    target_lock = _next_lock_id()
+    assert acquire_lock(target_lock, lock_uuid)
+    assert release_lock(target_lock, lock_uuid)
+
+@pytest.mark.integration
+def test_lock_pooled_connections_contention():
+    # the second owner hits the IntegrityError path, which must check out its own connection
+    first_lock_uuid = _next_lock_id()
+    second_lock_uuid = _next_lock_id()
+    target_lock = _next_lock_id()
     assert acquire_lock(target_lock, first_lock_uuid)
     assert not acquire_lock(target_lock, second_lock_uuid)
     assert acquire_lock(target_lock, first_lock_uuid)
-    release_lock(target_lock, first_lock_uuid)
+    assert release_lock(target_lock, first_lock_uuid)
     assert acquire_lock(target_lock, second_lock_uuid)
     assert not acquire_lock(target_lock, first_lock_uuid)
-    release_lock(target_lock, second_lock_uuid)
+    assert release_lock(target_lock, second_lock_uuid)
 
-    
 @pytest.mark.integration
 def test_lock_timeout(monkeypatch):
     monkeypatch.setattr(get_global_runtime_settings(), "lock_timeout_seconds", 0)
-    first_lock_uuid = str(uuid.uuid4())
-    second_lock_uuid = str(uuid.uuid4())
-    target_lock = str(uuid.uuid4())
-    assert acquire_lock(target_lock, first_lock_uuid)
-    assert acquire_lock(target_lock, second_lock_uuid)
+    first_lock_uuid = _next_lock_id()
+    second_lock_uuid = _next_lock_id()
+    target_lock = _next_lock_id()
+    with get_db_connection() as db:
+        assert acquire_lock(target_lock, first_lock_uuid, db=db)
+        assert acquire_lock(target_lock, second_lock_uuid, db=db)
 
 @pytest.mark.integration
 def test_clear_expired_locks(monkeypatch):
     monkeypatch.setattr(get_global_runtime_settings(), "lock_timeout_seconds", 0)
-    # insert a lock that is already expired
-    target = str(uuid.uuid4())
-    lock_uuid = str(uuid.uuid4())
-    assert acquire_lock(target, lock_uuid)
-    # this should clear out the lock
-    clear_expired_locks()
-    # make sure it's gone
     with get_db_connection() as db:
+        # insert a lock that is already expired
+        target = _next_lock_id()
+        lock_uuid = _next_lock_id()
+        assert acquire_lock(target, lock_uuid, db=db)
+        # this should clear out the lock
+        clear_expired_locks(db=db)
+        # make sure it's gone
         cursor = db.cursor()
         cursor.execute("SELECT uuid FROM locks WHERE uuid = %s", (target,))
-        assert cursor.fetchone() is None
\ No newline at end of file
+        assert cursor.fetchone() is None
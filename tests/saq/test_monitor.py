@@ -1,9 +1,12 @@
 from datetime import datetime, timedelta
+from functools import partial
 from io import StringIO
 from unittest.mock import MagicMock, patch
 import pytest
 import re
 
+from fluent import sender
+
 from saq.configuration.schema import MonitorDefinitionConfig
 from saq.monitor import MonitorEmitter, emit_monitor, enable_monitor_cache, enable_monitor_fluent_bit, enable_monitor_logging, enable_monitor_stderr, enable_monitor_stdout, get_emitter, reset_emitter, set_monitor_definitions
 from saq.monitor_definitions import MONITOR_TEST
@@ -12,35 +15,82 @@ from tests.saq.helpers import log_count
 LOG_TEST = "log test"
 LOG_TEST_2 = "log test 2"
 
+# expected dump_cache output, e.g. (test): log test 2 @ 2025-04-09 12:43:11.524041
+_CACHE_DUMP_RE = re.compile(r"^\(test\): log test 2 @ \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}$")
+_CACHE_DUMP_ID_RE = re.compile(r"^\(test:id\): log test @ \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}$")
+
+# definitions for MONITOR_TEST, validated once and shared by the tests (the emitter does not modify them)
+_DISABLED_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=False)]
+_ENABLED_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=True)]
+_SUPPRESSED_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, suppression_duration=60)]
+_DISABLED_WITH_SUPPRESSION_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=False, suppression_duration=60)]
+_DEDUP_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True)]
+_DEDUP_WITH_SUPPRESSION_DEFS = [MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True, suppression_duration=60)]
+
+@pytest.fixture(scope="module")
+def emitter():
+    """The global emitter, which the root conftest resets in place around every test."""
+    return get_emitter()
+
+@pytest.fixture
+def stdout_buf(monkeypatch):
+    """Sends the emitter's stdout output to a StringIO for tests that only check what was printed.
+    print() is redirected rather than sys.stdout since pytest's own capture restores sys.stdout
+    before each test runs."""
+    buf = StringIO()
+    monkeypatch.setattr("saq.monitor.print", partial(print, file=buf), raising=False)
+    return buf
+
+class _FrozenClock:
+    """Controls the time seen by saq.monitor, see the frozen_time fixture."""
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def tick(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freezes datetime.now() in saq.monitor. Call tick() on the returned clock to advance time."""
+    clock = _FrozenClock(datetime(2025, 1, 1, 12, 0, 0))
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    monkeypatch.setattr("saq.monitor.datetime", _FrozenDatetime)
+    return clock
+
+def _drain(buf: StringIO) -> str:
+    """Returns what was written to buf and clears it (like capsys.readouterr())."""
+    value = buf.getvalue()
+    buf.seek(0)
+    buf.truncate(0)
+    return value
+
 @pytest.mark.unit
 def test_get_emitter():
     assert isinstance(get_emitter(), MonitorEmitter)
 
 @pytest.mark.unit
-def test_emit_monitor_logging():
-    emit_monitor(MONITOR_TEST, LOG_TEST)
+@pytest.mark.parametrize("identifier", [None, "id"], ids=["no_identifier", "with_identifier"])
+def test_emit_monitor_logging(identifier):
+    emit_monitor(MONITOR_TEST, LOG_TEST, identifier)
     assert log_count(LOG_TEST) == 0
     enable_monitor_logging()
-    emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert log_count(LOG_TEST) == 1
-
-@pytest.mark.unit
-def test_emit_monitor_logging_with_identifier():
-    emit_monitor(MONITOR_TEST, LOG_TEST, "id")
-    assert log_count(LOG_TEST) == 0
-    enable_monitor_logging()
-    emit_monitor(MONITOR_TEST, LOG_TEST, "id")
+    emit_monitor(MONITOR_TEST, LOG_TEST, identifier)
     assert log_count(LOG_TEST) == 1
 
 @pytest.mark.unit
-def test_emit_monitor_stdout(capsys):
+def test_emit_monitor_stdout(stdout_buf):
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
     enable_monitor_stdout()
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
 @pytest.mark.unit
 def test_emit_monitor_stderr(capsys):
@@ -53,19 +103,24 @@ def test_emit_monitor_stderr(capsys):
     assert LOG_TEST in captured.err
 
 @pytest.mark.unit
-def test_emit_monitor_cache():
+def test_emit_monitor_cache(emitter):
+    # the cache dict is only replaced by reset_emitter() so it can be bound once
+    cache = emitter.cache
+    path = MONITOR_TEST.path
+    _buffer = StringIO()
+
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert not get_emitter().cache
+    assert not cache
     enable_monitor_cache()
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert get_emitter().cache
-    cache_entry = get_emitter().cache[MONITOR_TEST.path]
+    assert cache
+    cache_entry = cache[path]
     assert cache_entry.value == LOG_TEST
     assert not cache_entry.identifier
 
     # emit the same message and get a different cache entry
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    new_cache_entry= get_emitter().cache[MONITOR_TEST.path]
+    new_cache_entry= cache[path]
     assert cache_entry is not new_cache_entry
     assert cache_entry.value == LOG_TEST
     assert not cache_entry.identifier
@@ -73,141 +128,120 @@ def test_emit_monitor_cache():
 
     # emit a new message and get a new cache entry with a different value
     emit_monitor(MONITOR_TEST, LOG_TEST_2)
-    new_cache_entry= get_emitter().cache[MONITOR_TEST.path]
+    new_cache_entry= cache[path]
     assert cache_entry is not new_cache_entry
     assert new_cache_entry.value == LOG_TEST_2
     assert not new_cache_entry.identifier
 
     # dump the cache
-    _buffer = StringIO()
-    get_emitter().dump_cache(_buffer)
+    emitter.dump_cache(_buffer)
     # (test): log test 2 @ 2025-04-09 12:43:11.524041
-    assert re.match(r"^\(test\): log test 2 @ [0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6}$", _buffer.getvalue().strip())
+    assert _CACHE_DUMP_RE.match(_drain(_buffer).strip())
 
     # emit a new message with an identifier
     emit_monitor(MONITOR_TEST, LOG_TEST, "id")
-    new_cache_entry= get_emitter().cache[MONITOR_TEST.path]
+    new_cache_entry= cache[path]
     assert cache_entry is not new_cache_entry
     assert new_cache_entry.value == LOG_TEST
     assert new_cache_entry.identifier == "id"
 
     # dump the cache
-    _buffer = StringIO()
-    get_emitter().dump_cache(_buffer)
+    emitter.dump_cache(_buffer)
     # (test:id): log test @ 2025-04-09 12:43:11.524041
-    assert re.match(r"^\(test:id\): log test @ [0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6}$", _buffer.getvalue().strip())
+    assert _CACHE_DUMP_ID_RE.match(_drain(_buffer).strip())
 
 @pytest.mark.unit
-def test_fluent_bit_not_called_when_disabled():
-    """fluent-bit sender is not called when use_fluent_bit is False (default)"""
-    emitter = get_emitter()
-    assert not emitter.use_fluent_bit
-    assert emitter.fluent_bit_sender is None
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
+class TestFluentBit:
+    """Tests for the fluent-bit output, with FluentSender patched for every test in the class."""
+
+    @pytest.fixture(autouse=True)
+    def _patches(self):
+        # saq.monitor creates the sender with fluent's sender.FluentSender
+        with patch.object(sender, "FluentSender") as mock_sender_class:
+            self.mock_sender_class = mock_sender_class
+            self.mock_sender_instance = MagicMock()
+            mock_sender_class.return_value = self.mock_sender_instance
+            yield
+
+    def test_not_called_when_disabled(self, emitter):
+        """fluent-bit sender is not called when use_fluent_bit is False (default)"""
+        assert not emitter.use_fluent_bit
+        assert emitter.fluent_bit_sender is None
         emit_monitor(MONITOR_TEST, LOG_TEST)
-        mock_sender_class.assert_not_called()
-
-@pytest.mark.unit
-def test_fluent_bit_emits_structured_data():
-    """fluent-bit emits structured data with correct fields when enabled"""
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
-        mock_sender_instance = MagicMock()
-        mock_sender_class.return_value = mock_sender_instance
+        self.mock_sender_class.assert_not_called()
 
+    @pytest.mark.parametrize("identifier", [None, "test-id"], ids=["no_identifier", "with_identifier"])
+    def test_emits_structured_data(self, identifier):
+        """fluent-bit emits structured data with correct fields when enabled"""
         enable_monitor_fluent_bit("localhost", 24224, "ace.monitor")
-        emit_monitor(MONITOR_TEST, LOG_TEST)
+        emit_monitor(MONITOR_TEST, LOG_TEST, identifier)
 
-        mock_sender_instance.emit.assert_called_once()
-        call_args = mock_sender_instance.emit.call_args
+        self.mock_sender_instance.emit.assert_called_once()
+        call_args = self.mock_sender_instance.emit.call_args
         assert call_args[0][0] is None
         data = call_args[0][1]
         assert data["path"] == MONITOR_TEST.path
         assert data["value"] == LOG_TEST
         assert "timestamp" in data
-        assert "identifier" not in data
+        if identifier is None:
+            assert "identifier" not in data
+        else:
+            assert data["identifier"] == identifier
 
-@pytest.mark.unit
-def test_fluent_bit_emits_with_identifier():
-    """fluent-bit includes identifier in structured data when provided"""
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
-        mock_sender_instance = MagicMock()
-        mock_sender_class.return_value = mock_sender_instance
-
-        enable_monitor_fluent_bit("localhost", 24224, "ace.monitor")
-        emit_monitor(MONITOR_TEST, LOG_TEST, "test-id")
-
-        mock_sender_instance.emit.assert_called_once()
-        data = mock_sender_instance.emit.call_args[0][1]
-        assert data["identifier"] == "test-id"
-
-@pytest.mark.unit
-def test_fluent_bit_error_does_not_crash():
-    """errors in fluent-bit emission are logged but do not crash the emitter"""
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
-        mock_sender_instance = MagicMock()
-        mock_sender_instance.emit.side_effect = Exception("connection refused")
-        mock_sender_class.return_value = mock_sender_instance
+    def test_error_does_not_crash(self):
+        """errors in fluent-bit emission are logged but do not crash the emitter"""
+        self.mock_sender_instance.emit.side_effect = Exception("connection refused")
 
         enable_monitor_fluent_bit("localhost", 24224, "ace.monitor")
         result = emit_monitor(MONITOR_TEST, LOG_TEST)
         assert result is True
 
-@pytest.mark.unit
-def test_fluent_bit_sender_created_with_correct_params():
-    """FluentSender is created with the correct host, port, and tag"""
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
+    def test_sender_created_with_correct_params(self, emitter):
+        """FluentSender is created with the correct host, port, and tag"""
         enable_monitor_fluent_bit("fb-host", 12345, "my.tag")
 
-        mock_sender_class.assert_called_once_with("my.tag", host="fb-host", port=12345)
-        assert get_emitter().use_fluent_bit is True
-
-@pytest.mark.unit
-def test_reset_emitter_closes_sender():
-    """reset_emitter closes the fluent-bit sender before replacing the emitter"""
-    with patch("saq.monitor.sender.FluentSender") as mock_sender_class:
-        mock_sender_instance = MagicMock()
-        mock_sender_class.return_value = mock_sender_instance
+        self.mock_sender_class.assert_called_once_with("my.tag", host="fb-host", port=12345)
+        assert emitter.use_fluent_bit is True
 
+    def test_reset_emitter_closes_sender(self, emitter):
+        """reset_emitter closes the fluent-bit sender and resets the emitter in place"""
         enable_monitor_fluent_bit("localhost", 24224, "ace.monitor")
         reset_emitter()
 
-        mock_sender_instance.close.assert_called_once()
-        assert get_emitter().fluent_bit_sender is None
-        assert not get_emitter().use_fluent_bit
+        self.mock_sender_instance.close.assert_called_once()
+        assert get_emitter() is emitter
+        assert emitter.fluent_bit_sender is None
+        assert not emitter.use_fluent_bit
 
 
 @pytest.mark.unit
-def test_emit_disabled_monitor(capsys):
+def test_emit_disabled_monitor(stdout_buf, emitter):
     """disabled monitor produces no output on any backend and returns False"""
     enable_monitor_stdout()
     enable_monitor_cache()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=False),
-    ])
+    set_monitor_definitions(_DISABLED_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
-    assert not get_emitter().cache
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
+    assert not emitter.cache
 
 
 @pytest.mark.unit
-def test_emit_enabled_monitor(capsys):
+def test_emit_enabled_monitor(stdout_buf):
     """explicitly enabled monitor works normally"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=True),
-    ])
+    set_monitor_definitions(_ENABLED_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
 
 @pytest.mark.unit
-def test_emit_monitor_not_in_definitions(capsys):
+def test_emit_monitor_not_in_definitions(stdout_buf):
     """monitor absent from definitions works normally (backward compat)"""
     enable_monitor_stdout()
     set_monitor_definitions([
@@ -216,105 +250,72 @@ def test_emit_monitor_not_in_definitions(capsys):
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
-
-
-@pytest.mark.unit
-def test_suppression_first_emission_goes_through(capsys):
-    """first emit with suppression configured succeeds"""
-    enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, suppression_duration=60),
-    ])
-
-    result = emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
 
 @pytest.mark.unit
-def test_suppression_blocks_within_window(capsys):
-    """second emit within suppression window returns False and produces no output"""
+def test_suppression_window(stdout_buf, frozen_time):
+    """the first emit goes through, emits within the suppression window are blocked and emits after it elapses go through"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, suppression_duration=60),
-    ])
+    set_monitor_definitions(_SUPPRESSED_DEFS)
 
     # first emission goes through
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    capsys.readouterr()
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
-    # second emission within window is suppressed
+    # emission within the window is suppressed
+    frozen_time.tick(59)
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
-
-
-@pytest.mark.unit
-def test_suppression_allows_after_window_elapses(capsys):
-    """emit after suppression window elapses succeeds"""
-    enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, suppression_duration=60),
-    ])
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
 
-    # first emission goes through
+    # emission after the window elapses goes through
+    frozen_time.tick(2)
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    capsys.readouterr()
-
-    # simulate time passing beyond the suppression window
-    get_emitter()._last_emission_times[MONITOR_TEST.path] = datetime.now() - timedelta(seconds=61)
-
-    result = emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
 
 @pytest.mark.unit
-def test_suppression_blocks_all_backends():
+def test_suppression_blocks_all_backends(emitter):
     """suppressed emit does not update cache or any other backend"""
     enable_monitor_cache()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, suppression_duration=60),
-    ])
+    set_monitor_definitions(_SUPPRESSED_DEFS)
 
     # first emission populates cache
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert get_emitter().cache
+    assert emitter.cache
 
     # clear the cache to verify second emission does not touch it
-    get_emitter().cache.clear()
+    emitter.cache.clear()
 
     # second emission within window is suppressed
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    assert not get_emitter().cache
+    assert not emitter.cache
 
 
 @pytest.mark.unit
-def test_disabled_with_suppression_stays_disabled(capsys):
+def test_disabled_with_suppression_stays_disabled(stdout_buf, emitter):
     """enabled=False takes precedence over suppression_duration"""
     enable_monitor_stdout()
     enable_monitor_cache()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=False, suppression_duration=60),
-    ])
+    set_monitor_definitions(_DISABLED_WITH_SUPPRESSION_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
-    assert not get_emitter().cache
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
+    assert not emitter.cache
 
 
 @pytest.mark.unit
-def test_glob_pattern_matching(capsys):
+def test_glob_pattern_matching(stdout_buf):
     """glob pattern matches multiple monitor paths"""
     from saq.monitor import Monitor
     enable_monitor_stdout()
@@ -337,7 +338,7 @@ def test_glob_pattern_matching(capsys):
 
 
 @pytest.mark.unit
-def test_multiple_pattern_conflict_logs_warning(capsys):
+def test_multiple_pattern_conflict_logs_warning(stdout_buf):
     """when multiple patterns match a monitor path, a warning is logged and no definition is applied"""
     from saq.monitor import Monitor
     import logging
@@ -360,131 +361,116 @@ def test_multiple_pattern_conflict_logs_warning(capsys):
 
 
 @pytest.mark.unit
-def test_definition_cache_is_cleared_on_set_definitions():
+def test_definition_cache_is_cleared_on_set_definitions(emitter):
     """setting new definitions clears the resolved definition cache"""
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=False),
-    ])
+    set_monitor_definitions(_DISABLED_DEFS)
 
-    emitter = get_emitter()
     # resolve once to populate cache
     emitter._resolve_definition(MONITOR_TEST.path)
     assert MONITOR_TEST.path in emitter._definition_cache
 
     # set new definitions should clear cache
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, enabled=True),
-    ])
+    set_monitor_definitions(_ENABLED_DEFS)
     assert not emitter._definition_cache
 
 
 @pytest.mark.unit
-def test_dedup_first_emission_goes_through(capsys):
+def test_dedup_first_emission_goes_through(stdout_buf):
     """first emit with dedup=True succeeds"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True),
-    ])
+    set_monitor_definitions(_DEDUP_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST in out
 
 
 @pytest.mark.unit
-def test_dedup_blocks_duplicate_value(capsys):
+def test_dedup_blocks_duplicate_value(stdout_buf):
     """second emit with same value returns False and produces no output"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True),
-    ])
+    set_monitor_definitions(_DEDUP_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    capsys.readouterr()
+    _drain(stdout_buf)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
 
 
 @pytest.mark.unit
-def test_dedup_allows_different_value(capsys):
+def test_dedup_allows_different_value(stdout_buf):
     """emit with different value succeeds after dedup block"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True),
-    ])
+    set_monitor_definitions(_DEDUP_DEFS)
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    capsys.readouterr()
+    _drain(stdout_buf)
 
     # same value is blocked
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    capsys.readouterr()
+    _drain(stdout_buf)
 
     # different value goes through
     result = emit_monitor(MONITOR_TEST, LOG_TEST_2)
     assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST_2 in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST_2 in out
 
 
 @pytest.mark.unit
-def test_dedup_blocks_all_backends():
+def test_dedup_blocks_all_backends(emitter):
     """deduplicated emit does not update cache or other backends"""
     enable_monitor_cache()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True),
-    ])
+    set_monitor_definitions(_DEDUP_DEFS)
 
     # first emission populates cache
     emit_monitor(MONITOR_TEST, LOG_TEST)
-    assert get_emitter().cache
+    assert emitter.cache
 
     # clear cache to verify second emission does not touch it
-    get_emitter().cache.clear()
+    emitter.cache.clear()
 
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    assert not get_emitter().cache
+    assert not emitter.cache
 
 
 @pytest.mark.unit
-def test_dedup_with_suppression(capsys):
+def test_dedup_with_suppression(stdout_buf, frozen_time):
     """dedup and suppression interact correctly"""
     enable_monitor_stdout()
-    set_monitor_definitions([
-        MonitorDefinitionConfig(pattern=MONITOR_TEST.path, dedup=True, suppression_duration=60),
-    ])
+    set_monitor_definitions(_DEDUP_WITH_SUPPRESSION_DEFS)
 
     # first emission goes through
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is True
-    capsys.readouterr()
+    _drain(stdout_buf)
 
     # second emission within suppression window is blocked by suppression
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
 
-    # simulate suppression window elapsing
-    get_emitter()._last_emission_times[MONITOR_TEST.path] = datetime.now() - timedelta(seconds=61)
+    # let the suppression window elapse
+    frozen_time.tick(61)
 
     # same value is now blocked by dedup (suppression passes but dedup catches it)
     result = emit_monitor(MONITOR_TEST, LOG_TEST)
     assert result is False
-    captured = capsys.readouterr()
-    assert LOG_TEST not in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST not in out
 
-    # simulate suppression window elapsing again
-    get_emitter()._last_emission_times[MONITOR_TEST.path] = datetime.now() - timedelta(seconds=61)
+    # let the suppression window elapse again
+    frozen_time.tick(61)
 
     # different value goes through (both suppression and dedup pass)
     result = emit_monitor(MONITOR_TEST, LOG_TEST_2)
     assert result is True
-    captured = capsys.readouterr()
-    assert LOG_TEST_2 in captured.out
+    out = _drain(stdout_buf)
+    assert LOG_TEST_2 in out
@@ -7,6 +7,11 @@ from saq.util.strings import (
     is_base64,
 )
 
+# built once at import rather than in the test bodies; format_item_list_for_summary does not modify its input
+_ITEMS_100 = [str(i) for i in range(100)]
+_ITEMS_25 = [f"item{i}" for i in range(25)]
+_EXPECTED_DEFAULT = ", ".join(_ITEMS_25[:20]) + " + 5 more"
+
 
 class TestFormatItemListForSummary:
     
@@ -31,7 +36,7 @@ class TestFormatItemListForSummary:
         (["a", "b", "c", "d", "e", "f"], 3, "a, b, c + 3 more"),
         
         # Over limit - many items
-        ([str(i) for i in range(100)], 5, "0, 1, 2, 3, 4 + 95 more"),
+        (_ITEMS_100, 5, "0, 1, 2, 3, 4 + 95 more"),
         
         # Custom max_items smaller than default
         (["x", "y", "z"], 1, "x + 2 more"),
@@ -52,11 +57,7 @@ class TestFormatItemListForSummary:
     @pytest.mark.unit
     def test_format_item_list_for_summary_default_max_items(self):
         # Test that default max_items is 20
-        items = [f"item{i}" for i in range(25)]
-        result = format_item_list_for_summary(items)
-        expected_items = ", ".join([f"item{i}" for i in range(20)])
-        expected = f"{expected_items} + 5 more"
-        assert result == expected
+        assert format_item_list_for_summary(_ITEMS_25) == _EXPECTED_DEFAULT
 
 
 class TestDecodeBase64:
@@ -4,63 +4,28 @@ from datetime import datetime
 from saq.environment import get_local_timezone
 from saq.util.time import calculate_backoff_delay, parse_event_time, parse_iso8601
 
+# a tz_offset_seconds of None means the time has no offset and is parsed in the local timezone
 @pytest.mark.unit
-def test_util_000_date_parsing():
-    default_format = '2018-10-19 14:06:34 +0000'
-    old_default_format = '2018-10-19 14:06:34'
-    json_format = '2018-10-19T18:08:08.346118-05:00'
-    old_json_format = '2018-10-19T18:08:08.346118'
-    splunk_format = '2015-02-19T09:50:49.000-05:00'
-
-    result = parse_event_time(default_format)
-    assert result.year == 2018
-    assert result.month == 10
-    assert result.day == 19
-    assert result.hour == 14
-    assert result.minute == 6
-    assert result.second == 34
-    assert result.tzinfo
-    assert int(result.tzinfo.utcoffset(None).total_seconds()) == 0
-
-    result = parse_event_time(old_default_format)
-    assert result.year == 2018
-    assert result.month == 10
-    assert result.day == 19
-    assert result.hour == 14
-    assert result.minute == 6
-    assert result.second == 34
-    assert result.tzinfo
-    assert get_local_timezone().tzname == result.tzinfo.tzname
-    
-    result = parse_event_time(json_format)
-    assert result.year == 2018
-    assert result.month == 10
-    assert result.day == 19
-    assert result.hour == 18
-    assert result.minute == 8
-    assert result.second == 8
-    assert result.tzinfo
-    assert int(result.tzinfo.utcoffset(None).total_seconds()) == -(5 * 60 * 60)
-
-    result = parse_event_time(old_json_format)
-    assert result.year == 2018
-    assert result.month == 10
-    assert result.day == 19
-    assert result.hour == 18
-    assert result.minute == 8
-    assert result.second == 8
-    assert result.tzinfo
-    assert get_local_timezone().tzname == result.tzinfo.tzname
-
-    result = parse_event_time(splunk_format)
-    assert result.year == 2015
-    assert result.month == 2
-    assert result.day == 19
-    assert result.hour == 9
-    assert result.minute == 50
-    assert result.second == 49
+@pytest.mark.parametrize("event_time,year,month,day,hour,minute,second,tz_offset_seconds", [
+    ('2018-10-19 14:06:34 +0000', 2018, 10, 19, 14, 6, 34, 0),
+    ('2018-10-19 14:06:34', 2018, 10, 19, 14, 6, 34, None),
+    ('2018-10-19T18:08:08.346118-05:00', 2018, 10, 19, 18, 8, 8, -(5 * 60 * 60)),
+    ('2018-10-19T18:08:08.346118', 2018, 10, 19, 18, 8, 8, None),
+    ('2015-02-19T09:50:49.000-05:00', 2015, 2, 19, 9, 50, 49, -(5 * 60 * 60)),
+], ids=["default", "old_default", "json", "old_json", "splunk"])
+def test_util_000_date_parsing(event_time, year, month, day, hour, minute, second, tz_offset_seconds):
+    result = parse_event_time(event_time)
+    assert result.year == year
+    assert result.month == month
+    assert result.day == day
+    assert result.hour == hour
+    assert result.minute == minute
+    assert result.second == second
     assert result.tzinfo
-    assert int(result.tzinfo.utcoffset(None).total_seconds()), -(5 * 60 * 60)
+    if tz_offset_seconds is None:
+        assert get_local_timezone().tzname == result.tzinfo.tzname
+    else:
+        assert int(result.tzinfo.utcoffset(None).total_seconds()) == tz_offset_seconds
 
 @pytest.mark.unit
 @pytest.mark.parametrize("iso_string,year,month,day,hour,minute,second,microsecond,tz_offset_seconds", [